@@ -0,0 +1,122 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection, transaction
+
+STAMP_KEY = 'yamdb:stamp:{namespace}'
+RESPONSE_KEY = 'yamdb:response:{digest}'
+STATS_KEY = 'yamdb:cache-stats:{name}'
+CACHE_HIT = 'hits'
+CACHE_MISS = 'misses'
+
+TITLES_STAMP = 'titles'
+TAXONOMY_STAMP = 'taxonomy'
+TITLE_STAMP = 'title:{pk}'
+REVIEWS_STAMP = 'reviews:{title_id}'
+COMMENTS_STAMP = 'comments:{review_id}'
+USERS_STAMP = 'users'
+
+# Бэкенды, которые хранят значения в памяти процесса или не хранят
+# вовсе: штамп, сдвинутый в одном процессе, другие не увидят.
+PER_PROCESS_CACHES = (LocMemCache, DummyCache)
+
+
+def get_stamp_cache():
+    return caches[settings.VERSION_STAMP_CACHE]
+
+
+def stamps_are_shared():
+    """Видят ли все процессы сервера одни и те же штампы версий."""
+    return not isinstance(get_stamp_cache(), PER_PROCESS_CACHES)
+
+
+def get_stamps(*namespaces):
+    """
+    Возвращает штампы версий пространств имён в порядке аргументов.
+    Штамп — время последнего изменения в наносекундах, хранится
+    в кэше VERSION_STAMP_CACHE; отсутствующий штамп создаётся
+    текущим временем.
+    """
+    stamp_cache = get_stamp_cache()
+    keys = [STAMP_KEY.format(namespace=namespace) for namespace in namespaces]
+    stamps = stamp_cache.get_many(keys)
+    for key in keys:
+        if key not in stamps:
+            stamp_cache.add(key, time.time_ns(), timeout=None)
+            stamps[key] = stamp_cache.get(key)
+    return [stamps[key] for key in keys]
+
+
+def _bump_stamps(keys):
+    stamp_cache = get_stamp_cache()
+    stamps = stamp_cache.get_many(keys)
+    now = time.time_ns()
+    stamp_cache.set_many(
+        {key: max(now, stamps.get(key, 0) + 1) for key in keys},
+        timeout=None,
+    )
+
+
+def bump_stamps(*namespaces):
+    """
+    Сдвигает штампы версий, делая устаревшими все ответы,
+    закэшированные под прежними штампами.
+    Внутри транзакции штампы сдвигаются ещё раз после фиксации,
+    чтобы ответ, собранный параллельным запросом по старым данным,
+    не остался в кэше под новым штампом.
+    """
+    keys = [STAMP_KEY.format(namespace=namespace) for namespace in namespaces]
+    _bump_stamps(keys)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: _bump_stamps(keys))
+
+
+def get_request_digest(request, stamps):
+    """
+    Хэш адреса ресурса, отсортированных параметров запроса
+    и штампов версий: одинаков для запросов с одинаковым ответом.
+    """
+    return hashlib.md5(json.dumps([
+        request.get_host(),
+        request.path,
+        sorted(
+            (name, sorted(values))
+            for name, values in request.query_params.lists()
+        ),
+        stamps,
+    ]).encode()).hexdigest()
+
+
+def get_response_cache_key(request, stamps):
+    return RESPONSE_KEY.format(digest=get_request_digest(request, stamps))
+
+
+def count_cache_access(name):
+    """
+    Увеличивает счётчик попаданий или промахов одним обращением
+    к кэшу; счётчик создаётся при первом обращении.
+    """
+    key = STATS_KEY.format(name=name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_cache_stats():
+    """
+    Счётчики попаданий и промахов кэша ответов. Они хранятся
+    в кэше ответов: при кэше в памяти процесса — свои у каждого
+    процесса сервера.
+    """
+    names = (CACHE_HIT, CACHE_MISS)
+    values = cache.get_many([STATS_KEY.format(name=name) for name in names])
+    return {
+        name: values.get(STATS_KEY.format(name=name), 0) for name in names
+    }
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from .cache import stamps_are_shared
+
+PER_PROCESS_STAMPS_WARNING = (
+    'Штампы версий хранятся в кэше {alias}, который не общий '
+    'для процессов сервера: кэширование ответов и условные запросы '
+    'отключены.'
+)
+PER_PROCESS_STAMPS_HINT = (
+    'Укажите в CACHES["{alias}"] бэкенд, общий для всех процессов '
+    '(файловый для одного хоста, memcached, Redis или база данных).'
+)
+
+
+@register()
+def check_version_stamp_cache(app_configs, **kwargs):
+    if stamps_are_shared():
+        return []
+    alias = settings.VERSION_STAMP_CACHE
+    return [Warning(
+        PER_PROCESS_STAMPS_WARNING.format(alias=alias),
+        hint=PER_PROCESS_STAMPS_HINT.format(alias=alias),
+        id='api.W001',
+    )]
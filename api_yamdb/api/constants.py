@@ -1,5 +1,30 @@
 ALLOWED_HTTP_METHODS = ('get', 'post', 'delete', 'patch')
 ALLOWED_HTTP_METHODS_CATEGORY_GENRE = ('get', 'post', 'delete')
+TITLE_ORDERING = ('category_id', 'name', 'id')
+FEED_ORDERING = ('-pub_date', '-id')
+ACTIVITY_ORDERING = ('-pub_date', '-id', '-kind')
+ACTIVITY_COLUMNS = (
+    'id', 'pub_date', 'text', 'title_id', 'kind', 'parent_review',
+    'review_score',
+)
+TEXT_SEARCH_PARAM = 'search'
+TITLE_SEARCH_PARAM = 'search'
+TEXT_SEARCH_TYPE_PARAM = 'type'
+TEXT_SEARCH_TYPES = ('review', 'comment')
+TEXT_SEARCH_ORDERING = ('search_rank', 'id', 'kind')
+TEXT_SEARCH_COLUMNS = (*ACTIVITY_COLUMNS, 'author__username', 'search_rank')
+TITLE_FACETS = ('genre', 'category', 'year')
+TITLE_IDS_PARAM = 'ids'
+TITLE_BATCH_MAX_SIZE = 100
+EXPORT_FORMAT_PARAM = 'output'
+EXPORT_CHUNK_SIZE = 2000
+INCLUDE_PARAM = 'include'
+INCLUDE_DEFAULT_LIMIT = 3
+INCLUDE_MAX_LIMIT = 20
+BULK_REVIEWS_MAX_SIZE = 5000
+TITLE_ORDERING_FIELDS = (
+    'rating', 'weighted_rating', 'year', 'name', 'review_count'
+)
 
 SEND_MAIL_MESSAGE = (
     'Код подтверждения: {confirmation_code}'
@@ -17,3 +42,45 @@ EMAIL_REGISTER_ERROR = (
 REVIEW_VALIDATE_ERROR = (
     'Вы уже оставили отзыв на это произведение.'
 )
+INVALID_CURSOR_ERROR = (
+    'Некорректный курсор пагинации.'
+)
+CURSOR_PARAM_ERROR = (
+    'Курсорная пагинация использует собственный порядок, '
+    'параметр {param} с ней не поддерживается.'
+)
+UNKNOWN_FACETS_ERROR = (
+    'Неизвестные фасеты: {facets}. Допустимые значения: {allowed}.'
+)
+UNKNOWN_FIELDS_ERROR = (
+    'Неизвестные поля: {fields}. Допустимые значения: {allowed}.'
+)
+UNKNOWN_ORDERING_ERROR = (
+    'Неизвестные поля сортировки: {fields}. Допустимые значения: {allowed}.'
+)
+INVALID_IDS_ERROR = (
+    'Параметр ids должен содержать id произведений через запятую.'
+)
+TOO_MANY_IDS_ERROR = (
+    'За один запрос можно получить не больше {max_size} произведений.'
+)
+UNKNOWN_EXPORT_FORMAT_ERROR = (
+    'Неизвестный формат выгрузки: {output}. Допустимые значения: {allowed}.'
+)
+UNKNOWN_INCLUDE_ERROR = (
+    'Неизвестные связанные объекты: {includes}. '
+    'Допустимые значения: {allowed}.'
+)
+INVALID_INCLUDE_LIMIT_ERROR = (
+    'Количество связанных объектов {include} должно быть целым числом '
+    'от 1 до {max_limit}.'
+)
+BULK_REVIEWS_PAYLOAD_ERROR = (
+    'Ожидается список отзывов, не больше {max_size} за один запрос.'
+)
+TEXT_SEARCH_REQUIRED_ERROR = (
+    'Укажите текст для поиска.'
+)
+UNKNOWN_TEXT_SEARCH_TYPE_ERROR = (
+    'Неизвестный тип записей: {type}. Допустимые значения: {allowed}.'
+)
@@ -0,0 +1,87 @@
+import csv
+import json
+import re
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+CSV_COLUMNS = (
+    'id', 'name', 'year', 'rating', 'weighted_rating', 'description',
+    'category', 'genre',
+)
+CSV_LIST_SEPARATOR = ','
+
+
+class Echo:
+    """Файлоподобный объект для csv.writer: возвращает записанную строку."""
+
+    def write(self, value):
+        return value
+
+
+def iter_chunks(serializer, queryset, chunk_size):
+    """
+    Сериализованные произведения пачками по chunk_size: строки
+    читаются курсором iterator(), жанры — одним запросом на пачку,
+    поэтому в памяти не бывает больше одной пачки.
+    """
+    rows = serializer.get_queryset(queryset).iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield serializer.serialize(chunk)
+
+
+def render_ndjson(chunks):
+    for chunk in chunks:
+        yield ''.join(
+            json.dumps(item, ensure_ascii=False) + '\n' for item in chunk
+        )
+
+
+def get_csv_row(item):
+    return [
+        item['id'], item['name'], item['year'], item['rating'],
+        item['weighted_rating'], item['description'],
+        item['category']['slug'],
+        CSV_LIST_SEPARATOR.join(genre['slug'] for genre in item['genre']),
+    ]
+
+
+def render_csv(chunks):
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for chunk in chunks:
+        yield ''.join(writer.writerow(get_csv_row(item)) for item in chunk)
+
+
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', render_ndjson),
+    'csv': ('text/csv', render_csv),
+}
+
+
+def get_export_response(request, chunks, export_format, filename):
+    """
+    Потоковый ответ с выгрузкой в формате export_format.
+    Если клиент принимает gzip, поток сжимается на лету.
+    """
+    content_type, render = EXPORT_FORMATS[export_format]
+    content = (part.encode() for part in render(chunks))
+    gzip = ACCEPTS_GZIP.search(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    if gzip:
+        content = compress_sequence(content)
+    response = StreamingHttpResponse(
+        content, content_type=f'{content_type}; charset=utf-8'
+    )
+    response['Content-Disposition'] = (
+        f'attachment; filename="{filename}.{export_format}"'
+    )
+    if gzip:
+        response['Content-Encoding'] = 'gzip'
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
@@ -1,12 +1,96 @@
+from django.db.models import Count
 from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
 
-from reviews.models import Title
+from api.constants import UNKNOWN_ORDERING_ERROR
+from reviews.models import Category, Genre, Title
+from reviews.search import TITLE_SEARCH_INDEX
 
 
 class TitleFilter(filters.FilterSet):
     genre = filters.CharFilter(field_name='genre__slug')
     category = filters.CharFilter(field_name='category__slug')
+    search = filters.CharFilter(method='filter_search')
 
     class Meta:
         model = Title
         fields = ('name', 'year')
+
+    def filter_search(self, queryset, name, value):
+        """Полнотекстовый поиск по названию и описанию."""
+        return TITLE_SEARCH_INDEX.search(
+            queryset, value, ('name', 'description')
+        )
+
+
+class TitleMatchFilter(TitleFilter):
+    """
+    Те же фильтры, но поиск только отбирает произведения без
+    ранжирования: для фасетов и выгрузки, где порядок по
+    релевантности не нужен, а выборка встраивается подзапросом.
+    """
+
+    def filter_search(self, queryset, name, value):
+        return TITLE_SEARCH_INDEX.filter(
+            queryset, value, ('name', 'description')
+        )
+
+
+class StoredOrderingFilter(OrderingFilter):
+    """
+    Сортировка по параметру ordering только по полям ordering_fields
+    представления: это сохранённые столбцы с индексами, а не
+    вычисляемые агрегаты. Неизвестное поле — ошибка 400, а не
+    молчаливый пропуск. Для однозначного порядка в конец добавляется
+    id в направлении последнего поля, чтобы индекс читался
+    в одну сторону.
+    """
+
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        fields = list(dict.fromkeys(field for field in fields if field))
+        allowed = view.ordering_fields
+        unknown = {field.lstrip('-') for field in fields} - set(allowed)
+        if unknown:
+            raise ValidationError({
+                self.ordering_param: UNKNOWN_ORDERING_ERROR.format(
+                    fields=', '.join(sorted(unknown)),
+                    allowed=', '.join(allowed),
+                )
+            })
+        return fields
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        return self.add_tiebreaker(ordering)
+
+    @staticmethod
+    def add_tiebreaker(ordering):
+        sign = '-' if ordering[-1].startswith('-') else ''
+        return [*ordering, f'{sign}id']
+
+
+def count_title_facets(queryset, facets):
+    """
+    Количество произведений из queryset по значениям фасетов:
+    по одному сгруппированному запросу на фасет, выборка
+    произведений встраивается в него подзапросом.
+    """
+    title_ids = queryset.order_by().values('id')
+    groups = {'genre': Genre, 'category': Category}
+    result = {}
+    for facet in facets:
+        if facet in groups:
+            rows = groups[facet].objects.filter(
+                titles__in=title_ids
+            ).values('slug', 'name').annotate(
+                count=Count('titles')
+            ).order_by('name')
+        else:
+            rows = queryset.order_by().values(facet).annotate(
+                count=Count('id')
+            ).order_by(facet)
+        result[facet] = list(rows)
+    return result
@@ -0,0 +1,162 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from api.serializers import (
+    CategorySerializer, CommentSerializer, GenreSerializer, ReviewSerializer,
+    TitleReadSerializer
+)
+from api.values_serializers import ValuesSerializer
+from reviews.models import Category, Comment, Genre, Review, Title, User
+
+HELP = (
+    'Сравнение стоимости сериализации одного объекта через '
+    'ModelSerializer и через ValuesSerializer. Данные создаются '
+    'внутри транзакции и откатываются после замера.'
+)
+RESULT_HEADER = (
+    '{name:<22} {before:>14} {after:>14} {speedup:>8}'
+)
+RESULT_LINE = (
+    '{name:<22} {before:>11.2f} мкс {after:>11.2f} мкс {speedup:>7.1f}x'
+)
+OUTPUT_MISMATCH = 'Ответ ValuesSerializer для {name} отличается от DRF.'
+
+GROUPS_COUNT = 10
+AUTHORS_COUNT = 10
+GENRES_PER_TITLE = 2
+
+
+class Command(BaseCommand):
+    help = HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--items',
+            type=int,
+            default=1000,
+            help='Количество объектов каждой модели.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Количество повторов, берётся лучший результат.',
+        )
+
+    def seed(self, items):
+        Category.objects.bulk_create(
+            Category(name=f'Категория {i}', slug=f'category-{i}')
+            for i in range(GROUPS_COUNT)
+        )
+        Genre.objects.bulk_create(
+            Genre(name=f'Жанр {i}', slug=f'genre-{i}') for i in range(items)
+        )
+        User.objects.bulk_create(
+            User(username=f'author{i}', email=f'author{i}@yamdb.fake')
+            for i in range(AUTHORS_COUNT)
+        )
+        category_ids = list(Category.objects.values_list('id', flat=True))
+        genre_ids = list(Genre.objects.values_list('id', flat=True))
+        author_ids = list(User.objects.values_list('id', flat=True))
+        Title.objects.bulk_create(
+            Title(
+                name=f'Произведение {i}',
+                year=2000,
+                category_id=category_ids[i % GROUPS_COUNT],
+                description='Описание произведения',
+            )
+            for i in range(items)
+        )
+        title_ids = list(Title.objects.values_list('id', flat=True))
+        Title.genre.through.objects.bulk_create(
+            Title.genre.through(
+                title_id=title_id, genre_id=genre_ids[(i + shift) % items]
+            )
+            for i, title_id in enumerate(title_ids)
+            for shift in range(GENRES_PER_TITLE)
+        )
+        Review.objects.bulk_create(
+            Review(
+                title_id=title_ids[i],
+                author_id=author_ids[i % AUTHORS_COUNT],
+                text='Текст отзыва',
+                score=i % 10 + 1,
+            )
+            for i in range(items)
+        )
+        review = Review.objects.select_related('title').first()
+        Comment.objects.bulk_create(
+            Comment(
+                review=review,
+                title_id=review.title_id,
+                author_id=author_ids[i % AUTHORS_COUNT],
+                text='Текст комментария',
+            )
+            for i in range(items)
+        )
+
+    def get_cases(self):
+        return (
+            ('TitleReadSerializer', TitleReadSerializer,
+             Title.objects.select_related('category').prefetch_related(
+                 'genre'
+             )),
+            ('GenreSerializer', GenreSerializer, Genre.objects.all()),
+            ('CategorySerializer', CategorySerializer, Category.objects.all()),
+            ('ReviewSerializer', ReviewSerializer,
+             Review.objects.select_related('author')),
+            ('CommentSerializer', CommentSerializer,
+             Comment.objects.select_related('author')),
+        )
+
+    def measure(self, repeat, count, function):
+        best = min(
+            self.timed(function) for _ in range(repeat)
+        )
+        return best / max(count, 1) * 10 ** 6
+
+    @staticmethod
+    def timed(function):
+        started = time.perf_counter()
+        function()
+        return time.perf_counter() - started
+
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+        with transaction.atomic():
+            self.seed(options['items'])
+            self.stdout.write(RESULT_HEADER.format(
+                name='Сериализатор', before='ModelSerializer',
+                after='values()', speedup='Ускор.'
+            ))
+            for name, serializer_class, queryset in self.get_cases():
+                objects = list(queryset)
+                values_serializer = ValuesSerializer.for_serializer(
+                    serializer_class
+                )
+                rows = list(values_serializer.get_queryset(queryset))
+                nested_rows = values_serializer.load_nested_many(rows)
+                before_json = renderer.render(
+                    serializer_class(objects, many=True).data
+                )
+                after_json = renderer.render(
+                    values_serializer.serialize(rows, nested_rows)
+                )
+                if before_json != after_json:
+                    raise CommandError(OUTPUT_MISMATCH.format(name=name))
+                before = self.measure(
+                    options['repeat'], len(objects),
+                    lambda: serializer_class(objects, many=True).data
+                )
+                after = self.measure(
+                    options['repeat'], len(rows),
+                    lambda: values_serializer.serialize(rows, nested_rows)
+                )
+                self.stdout.write(RESULT_LINE.format(
+                    name=name, before=before, after=after,
+                    speedup=before / after if after else 0,
+                ))
+            transaction.set_rollback(True)
@@ -0,0 +1,222 @@
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from api_yamdb import settings
+from .cache import (
+    CACHE_HIT, CACHE_MISS, count_cache_access, get_request_digest,
+    get_response_cache_key, get_stamps, stamps_are_shared
+)
+from .constants import (
+    INCLUDE_DEFAULT_LIMIT, INCLUDE_MAX_LIMIT, INCLUDE_PARAM,
+    INVALID_INCLUDE_LIMIT_ERROR, UNKNOWN_INCLUDE_ERROR
+)
+from .values_serializers import ValuesSerializer
+
+CACHE_STATUS_HEADER = 'X-Cache'
+NANOSECONDS = 10 ** 9
+
+
+class VersionStampMixin:
+    """
+    Штампы версий данных, от которых зависит ответ представления.
+    Наследники перечисляют в cache_stamps шаблоны пространств имён,
+    они заполняются аргументами URL; набор, зависящий от запроса,
+    строится переопределённым get_cache_stamps().
+    Если штампы хранятся в памяти процесса, другие процессы
+    не видят их сдвигов, поэтому кэш и ETag не используются.
+    """
+    cache_stamps = ()
+
+    def get_cache_stamps(self):
+        return tuple(
+            stamp.format(**self.kwargs) for stamp in self.cache_stamps
+        )
+
+    def get_stamp_values(self):
+        if not hasattr(self, '_stamp_values'):
+            self._stamp_values = get_stamps(*self.get_cache_stamps())
+        return self._stamp_values
+
+
+class CachedResponseMixin(VersionStampMixin):
+    """
+    Кэширует ответы list и retrieve во фреймворке кэша Django.
+    Ключ ответа включает штампы версий, поэтому изменение данных
+    делает прежние ответы недостижимыми.
+    """
+    cache_timeout = settings.RESPONSE_CACHE_TIMEOUT
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        if not stamps_are_shared():
+            return handler(request, *args, **kwargs)
+        key = get_response_cache_key(request, self.get_stamp_values())
+        data = cache.get(key)
+        if data is not None:
+            count_cache_access(CACHE_HIT)
+            return Response(data, headers={CACHE_STATUS_HEADER: 'HIT'})
+        count_cache_access(CACHE_MISS)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, self.cache_timeout)
+        response[CACHE_STATUS_HEADER] = 'MISS'
+        return response
+
+
+class ConditionalGetMixin(VersionStampMixin):
+    """
+    Условные GET-запросы для list и retrieve: ETag и Last-Modified
+    вычисляются по штампам версий без сериализации ответа,
+    при совпадении возвращается 304 Not Modified.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def get_conditional_response(self, handler, request, *args, **kwargs):
+        if not stamps_are_shared():
+            return handler(request, *args, **kwargs)
+        stamps = self.get_stamp_values()
+        etag = quote_etag(get_request_digest(request, stamps))
+        last_modified = max(stamps) // NANOSECONDS
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            response = not_modified
+        else:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (
+            status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED
+        ):
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class ValuesListMixin:
+    """
+    Быстрый list: ответ строится ValuesSerializer по строкам values()
+    вместо экземпляров модели и полей ModelSerializer.
+    Подключается к представлению наследованием.
+    """
+
+    def get_requested_fields(self):
+        return None
+
+    def get_values_serializer(self):
+        fields = self.get_requested_fields()
+        return ValuesSerializer.for_serializer(
+            self.get_serializer_class(),
+            None if fields is None else tuple(fields),
+        )
+
+    def get_key_columns(self):
+        """Столбцы, по которым пагинатор строит курсор страницы."""
+        get_key_columns = getattr(self.paginator, 'get_key_columns', None)
+        if get_key_columns is None:
+            return ()
+        return get_key_columns(self.request)
+
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_values_serializer()
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = serializer.get_queryset(queryset, self.get_key_columns())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(queryset))
+
+
+class IncludeMixin:
+    """
+    Встраивание связанных объектов по параметру include=имя[:N]
+    (несколько имён — через запятую) в ответы действий include_actions.
+    Для каждого имени из includes представление реализует метод
+    include_<имя>(ids, limit), который возвращает словарь
+    {id объекта ответа: [первые limit связанных объектов]}
+    одним запросом для всех объектов ответа.
+    """
+    includes = ()
+    include_actions = ()
+
+    def get_includes(self):
+        """Запрошенные связанные объекты: словарь {имя: N}."""
+        if hasattr(self, '_includes'):
+            return self._includes
+        includes = {}
+        value = self.request.query_params.get(INCLUDE_PARAM)
+        if value and self.action in self.include_actions:
+            for item in value.split(','):
+                if not item:
+                    continue
+                name, _, limit = item.partition(':')
+                includes[name] = self.parse_include_limit(name, limit)
+            unknown = set(includes) - set(self.includes)
+            if unknown:
+                raise ValidationError({
+                    INCLUDE_PARAM: UNKNOWN_INCLUDE_ERROR.format(
+                        includes=', '.join(sorted(unknown)),
+                        allowed=', '.join(self.includes),
+                    )
+                })
+        self._includes = includes
+        return includes
+
+    @staticmethod
+    def parse_include_limit(name, limit):
+        if not limit:
+            return INCLUDE_DEFAULT_LIMIT
+        try:
+            limit = int(limit)
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= INCLUDE_MAX_LIMIT:
+            raise ValidationError({
+                INCLUDE_PARAM: INVALID_INCLUDE_LIMIT_ERROR.format(
+                    include=name, max_limit=INCLUDE_MAX_LIMIT
+                )
+            })
+        return limit
+
+    def add_includes(self, items, ids):
+        for name, limit in self.get_includes().items():
+            related = getattr(self, f'include_{name}')(ids, limit)
+            for item, pk in zip(items, ids):
+                item[name] = related.get(pk, [])
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if self.get_includes() and response.status_code == status.HTTP_200_OK:
+            items = response.data
+            if isinstance(items, dict):
+                items = items['results']
+            self.add_includes(items, [item['id'] for item in items])
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        if self.get_includes() and response.status_code == status.HTTP_200_OK:
+            lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+            self.add_includes([response.data], [
+                self.get_queryset().model._meta.pk.to_python(lookup)
+            ])
+        return response
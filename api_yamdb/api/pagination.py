@@ -0,0 +1,217 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from datetime import date
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import ValidationError as BadRequest
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from .constants import (
+    ACTIVITY_ORDERING, CURSOR_PARAM_ERROR, FEED_ORDERING,
+    INVALID_CURSOR_ERROR, TITLE_ORDERING, TITLE_SEARCH_PARAM
+)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Пагинация по ключу сортировки (keyset): следующая страница
+    выбирается условием «ключ больше последнего показанного»,
+    поэтому запрос не использует OFFSET и COUNT и стоит одинаково
+    на любой глубине. Поля ordering с префиксом «-» идут по убыванию,
+    последним полем должен быть уникальный ключ.
+    """
+    ordering = None
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        position = self.decode_cursor(
+            request.query_params.get(self.cursor_query_param)
+        )
+        page = list(
+            self.get_page_queryset(queryset, position)[:self.page_size + 1]
+        )
+        self.has_next = len(page) > self.page_size
+        self.page = page[:self.page_size]
+        return self.page
+
+    def get_page_queryset(self, queryset, position):
+        queryset = queryset.order_by(*self.ordering)
+        if position is None:
+            return queryset
+        return self.seek(queryset, position)
+
+    def seek(self, queryset, position):
+        try:
+            return queryset.filter(self.get_seek_filter(position))
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(INVALID_CURSOR_ERROR)
+
+    def get_seek_filter(self, position):
+        """
+        Строит условие (a, b, c) > (x, y, z) в виде
+        a >= x AND (a > x OR (a = x AND (b > y OR (b = y AND c > z)))).
+        Отдельное условие a >= x позволяет СУБД начать чтение индекса
+        сразу с позиции курсора, а не отбрасывать строки до неё.
+        """
+        condition = None
+        for field, value in reversed(tuple(zip(self.ordering, position))):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            seek = Q(**{f'{name}__{lookup}': value})
+            if condition is not None:
+                seek |= Q(**{name: value}) & condition
+            condition = seek
+        field, value = self.ordering[0], position[0]
+        lookup = 'lte' if field.startswith('-') else 'gte'
+        return Q(**{f'{field.lstrip("-")}__{lookup}': value}) & condition
+
+    def get_key_columns(self, request):
+        return [field.lstrip('-') for field in self.ordering]
+
+    def get_position(self, obj):
+        names = [field.lstrip('-') for field in self.ordering]
+        if isinstance(obj, dict):
+            values = [obj[name] for name in names]
+        else:
+            values = [getattr(obj, name) for name in names]
+        return [self.encode_value(value) for value in values]
+
+    @staticmethod
+    def encode_value(value):
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
+
+    def encode_cursor(self, position):
+        return base64.urlsafe_b64encode(
+            json.dumps(position, ensure_ascii=False).encode()
+        ).decode()
+
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound(INVALID_CURSOR_ERROR)
+        if (
+            not isinstance(position, list)
+            or len(position) != len(self.ordering)
+        ):
+            raise NotFound(INVALID_CURSOR_ERROR)
+        return position
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.get_position(self.page[-1])),
+        )
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+
+class PageNumberOrKeysetPagination(PageNumberPagination):
+    """
+    Постраничная пагинация по номеру страницы с включаемым
+    по запросу режимом keyset: он выбирается, если в запросе
+    есть параметр курсора (для первой страницы — пустой, `?cursor=`).
+    Порядок keyset-режима задан пагинатором, поэтому параметры
+    keyset_conflicting_params, меняющие порядок, вместе с курсором
+    отклоняются с ошибкой 400.
+    """
+    keyset_pagination_class = None
+    keyset_conflicting_params = (api_settings.ORDERING_PARAM,)
+
+    def is_keyset(self, request):
+        return (
+            self.keyset_pagination_class.cursor_query_param
+            in request.query_params
+        )
+
+    def get_key_columns(self, request):
+        if not self.is_keyset(request):
+            return ()
+        return self.keyset_pagination_class().get_key_columns(request)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.is_keyset(request):
+            for param in self.keyset_conflicting_params:
+                if request.query_params.get(param):
+                    raise BadRequest(
+                        {param: CURSOR_PARAM_ERROR.format(param=param)}
+                    )
+            self.keyset = self.keyset_pagination_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class TitleKeysetPagination(KeysetPagination):
+    """Keyset-пагинация произведений по категории, названию и id."""
+    ordering = TITLE_ORDERING
+
+
+class TitlePagination(PageNumberOrKeysetPagination):
+    keyset_pagination_class = TitleKeysetPagination
+    keyset_conflicting_params = (
+        *PageNumberOrKeysetPagination.keyset_conflicting_params,
+        TITLE_SEARCH_PARAM,
+    )
+
+
+class FeedKeysetPagination(KeysetPagination):
+    """Keyset-пагинация отзывов и комментариев от новых к старым."""
+    ordering = FEED_ORDERING
+
+
+class FeedPagination(PageNumberOrKeysetPagination):
+    keyset_pagination_class = FeedKeysetPagination
+
+
+class UnionKeysetPagination(KeysetPagination):
+    """
+    Keyset-пагинация объединения (UNION ALL) нескольких выборок
+    с одинаковыми столбцами: условие курсора применяется к каждой
+    части до объединения, чтобы каждая читала свой индекс сразу
+    с позиции курсора. Пагинатору передаётся список выборок.
+    """
+
+    def get_page_queryset(self, querysets, position):
+        if position is not None:
+            querysets = [
+                self.seek(queryset, position) for queryset in querysets
+            ]
+        first, *rest = querysets
+        return first.union(*rest, all=True).order_by(*self.ordering)
+
+
+class ActivityPagination(UnionKeysetPagination):
+    """
+    Лента отзывов и комментариев пользователя от новых к старым.
+    Порядок (pub_date, id, kind) совпадает с индексами
+    (author, pub_date, id) обеих частей, поэтому SQLite сливает
+    их без сортировки; kind различает отзыв и комментарий
+    с одинаковыми датой и id.
+    """
+    ordering = ACTIVITY_ORDERING
@@ -33,6 +33,12 @@ def is_authenticated_managers(request):
     )
 
 
+class ModeratorOrAdminPermission(BasePermission):
+    """Доступ только модератору или администратору."""
+    def has_permission(self, request, view):
+        return is_authenticated_managers(request)
+
+
 class AdminOrSafeMethodPermission(AdminOnlyPermission):
     """
     Разрешает доступ всем пользователям для безопасных методов запроса,
@@ -48,7 +54,8 @@ class AdminOrSafeMethodPermission(AdminOnlyPermission):
 class IsAuthorModeratorAdminOrReadOnly(BasePermission):
     """
     Операции на чтение разрешены всем, остальные - автору текста,
-    администратору или модератору.
+    администратору или модератору. Автор сравнивается по author_id,
+    без загрузки связанного пользователя.
     """
 
     def has_permission(self, request, view):
@@ -63,6 +70,6 @@ class IsAuthorModeratorAdminOrReadOnly(BasePermission):
         if is_safe_method(request):
             return True
         return (
-            obj.author == request.user
+            obj.author_id == request.user.id
             or is_authenticated_managers(request)
         )
@@ -1,8 +1,8 @@
-from rest_framework import serializers, exceptions
+from rest_framework import serializers
 
-from .constants import REVIEW_VALIDATE_ERROR
 import reviews.constants as const
 from reviews.models import Category, Comment, Genre, Review, Title, User
+from reviews.ratings import get_score_histogram, get_score_percentiles
 from reviews.validators import (
     validate_creation_year, validate_username_chars, validate_score
 )
@@ -68,33 +68,56 @@ class ReviewSerializer(serializers.ModelSerializer):
             'text',
             'author',
             'score',
-            'pub_date'
+            'pub_date',
+            'comment_count'
         )
 
     def validate_score(self, score):
         return validate_score(score)
 
-    def validate(self, data):
-        if self.context['request'].method == 'POST' and Review.objects.filter(
-                title_id=self.context['view'].kwargs['title_id'],
-                author=self.context['request'].user
-        ).exists():
-            raise exceptions.ValidationError(REVIEW_VALIDATE_ERROR)
-        return data
+
+class ScoreCountsField(serializers.Field):
+    """
+    Поле, вычисляемое по гистограмме оценок произведения.
+    value_fields — столбцы модели, из которых строится значение,
+    функция from_values получает их значения по порядку: так поле
+    строится и по объекту модели, и по строке values().
+    """
+    value_fields = const.SCORE_COUNT_FIELDS
+
+    def __init__(self, from_values, **kwargs):
+        self.from_values = from_values
+        kwargs.update(source='*', read_only=True)
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        return self.from_values(instance.score_counts)
 
 
 class TitleReadSerializer(serializers.ModelSerializer):
     genre = GenreSerializer(many=True, )
     category = CategorySerializer()
     rating = serializers.IntegerField(read_only=True)
+    weighted_rating = serializers.FloatField(read_only=True)
+    score_histogram = ScoreCountsField(from_values=get_score_histogram)
+    score_percentiles = ScoreCountsField(from_values=get_score_percentiles)
 
     class Meta:
         model = Title
         fields = (
-            'id', 'name', 'year', 'rating', 'description', 'genre', 'category'
+            'id', 'name', 'year', 'rating', 'weighted_rating',
+            'review_count', 'score_histogram', 'score_percentiles',
+            'description', 'genre', 'category'
         )
         read_only_fields = fields
 
+    def __init__(self, *args, fields=None, **kwargs):
+        """Необязательный fields оставляет в ответе только эти поля."""
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
 
 class TitleCreateUpdateSerializer(TitleReadSerializer):
     genre = serializers.SlugRelatedField(
@@ -128,3 +151,22 @@ class CommentSerializer(serializers.ModelSerializer):
             'author',
             'pub_date'
         )
+
+
+class ActivitySerializer(serializers.Serializer):
+    """
+    Отзыв или комментарий в ленте пользователя: строка объединённой
+    выборки, review — отзыв комментария, score — оценка отзыва.
+    """
+    type = serializers.CharField(source='kind')
+    id = serializers.IntegerField()
+    title = serializers.IntegerField(source='title_id')
+    review = serializers.IntegerField(source='parent_review')
+    text = serializers.CharField()
+    score = serializers.IntegerField(source='review_score')
+    pub_date = serializers.DateTimeField()
+
+
+class TextSearchHitSerializer(ActivitySerializer):
+    """Найденный отзыв или комментарий с автором."""
+    author = serializers.CharField(source='author__username')
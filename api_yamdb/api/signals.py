@@ -0,0 +1,110 @@
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_save
+)
+from django.dispatch import receiver
+
+from reviews.bulk import reviews_imported
+from reviews.counters import review_aggregates_changed
+from reviews.models import Category, Comment, Genre, Review, Title, User
+from reviews.purge import content_purged
+from reviews.ratings import title_aggregates_changed
+from .cache import (
+    COMMENTS_STAMP, REVIEWS_STAMP, TAXONOMY_STAMP, TITLE_STAMP, TITLES_STAMP,
+    USERS_STAMP, bump_stamps
+)
+
+
+def bump_title_stamps(*title_ids):
+    bump_stamps(
+        TITLES_STAMP, *(TITLE_STAMP.format(pk=pk) for pk in title_ids)
+    )
+
+
+@receiver(post_save, sender=Title)
+def invalidate_title(sender, instance, **kwargs):
+    bump_title_stamps(instance.pk)
+
+
+@receiver(post_delete, sender=Title)
+def invalidate_deleted_title(sender, instance, **kwargs):
+    bump_title_stamps(instance.pk)
+    bump_stamps(REVIEWS_STAMP.format(title_id=instance.pk))
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def invalidate_title_genres(sender, instance, action, reverse, pk_set,
+                            **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        bump_title_stamps(instance.pk)
+    elif pk_set:
+        bump_title_stamps(*pk_set)
+    else:
+        bump_stamps(TITLES_STAMP, TAXONOMY_STAMP)
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_taxonomy(sender, **kwargs):
+    bump_stamps(TITLES_STAMP, TAXONOMY_STAMP)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_review(sender, instance, **kwargs):
+    bump_title_stamps(instance.title_id)
+    bump_stamps(
+        REVIEWS_STAMP.format(title_id=instance.title_id),
+        COMMENTS_STAMP.format(review_id=instance.pk),
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment(sender, instance, **kwargs):
+    """Счётчик комментариев входит в ответы со списком отзывов."""
+    bump_stamps(
+        COMMENTS_STAMP.format(review_id=instance.review_id),
+        REVIEWS_STAMP.format(title_id=instance.title_id),
+    )
+
+
+@receiver(pre_save, sender=User)
+def remember_username(sender, instance, raw, **kwargs):
+    instance._previous_username = None
+    if not raw and instance.pk is not None:
+        instance._previous_username = User.objects.filter(
+            pk=instance.pk
+        ).values_list('username', flat=True).first()
+
+
+@receiver(post_save, sender=User)
+def invalidate_renamed_author(sender, instance, created, **kwargs):
+    """Имя автора входит в ответы с отзывами и комментариями."""
+    previous = getattr(instance, '_previous_username', None)
+    if not created and previous != instance.username:
+        bump_stamps(USERS_STAMP)
+
+
+@receiver(title_aggregates_changed)
+def invalidate_title_aggregates(sender, title_ids, **kwargs):
+    bump_title_stamps(*title_ids)
+
+
+@receiver(review_aggregates_changed)
+@receiver(reviews_imported)
+def invalidate_review_aggregates(sender, title_ids, **kwargs):
+    bump_stamps(
+        *(REVIEWS_STAMP.format(title_id=title_id) for title_id in title_ids)
+    )
+
+
+@receiver(content_purged)
+def invalidate_purged_content(sender, title_ids, review_ids, **kwargs):
+    bump_stamps(
+        *(REVIEWS_STAMP.format(title_id=title_id) for title_id in title_ids),
+        *(COMMENTS_STAMP.format(review_id=pk) for pk in review_ids),
+    )
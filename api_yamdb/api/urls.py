@@ -8,6 +8,8 @@ from .views import (
     TitleViewSet,
     CategoryViewSet,
     GenreViewSet,
+    TextSearchViewSet,
+    bulk_create_reviews,
     register_user,
     get_user_token,
 )
@@ -34,6 +36,11 @@ router_v1.register(
     TitleViewSet,
     basename='titles'
 )
+router_v1.register(
+    r'search',
+    TextSearchViewSet,
+    basename='search'
+)
 router_v1.register(
     r'categories',
     CategoryViewSet,
@@ -51,5 +58,6 @@ url_auth = [
 ]
 urlpatterns = [
     path('v1/', include(url_auth)),
+    path('v1/reviews/bulk/', bulk_create_reviews, name='reviews-bulk'),
     path('v1/', include(router_v1.urls)),
 ]
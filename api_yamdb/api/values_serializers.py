@@ -0,0 +1,220 @@
+from functools import lru_cache
+from operator import itemgetter
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import connections, models
+from django.db.models import F, Window
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import RowNumber
+from rest_framework import serializers
+
+# Поля модели, значения которых из values() уже совпадают
+# с результатом to_representation() поля сериализатора.
+IDENTITY_FIELDS = {
+    serializers.CharField: (
+        models.CharField, models.TextField, models.SlugField,
+        models.EmailField,
+    ),
+    serializers.IntegerField: (
+        models.IntegerField, models.BigIntegerField, models.AutoField,
+        models.BigAutoField, models.PositiveIntegerField,
+        models.PositiveSmallIntegerField, models.SmallIntegerField,
+    ),
+}
+# Сколько построенных сериализаторов хранится в кэше for_serializer.
+SERIALIZER_CACHE_SIZE = 64
+UNSUPPORTED_FIELD_ERROR = (
+    'Поле {field} сериализатора {serializer} нельзя построить '
+    'по строкам values().'
+)
+
+
+def compile_converter(field, model_field):
+    """
+    Функция преобразования значения столбца в значение ответа.
+    Повторяет to_representation() поля, но пропускает вызов,
+    если он ничего не меняет; None выводится как есть, как в DRF.
+    """
+    if isinstance(model_field, IDENTITY_FIELDS.get(type(field), ())):
+        return None
+    to_representation = field.to_representation
+
+    def convert(value):
+        return None if value is None else to_representation(value)
+
+    return convert
+
+
+class ValuesSerializer:
+    """
+    Сериализация только для чтения по строкам values(): поля
+    ModelSerializer заранее превращаются в пары «ключ строки —
+    преобразование», поэтому на каждый объект не создаются
+    экземпляры модели и не вызывается механизм полей DRF.
+    Результат совпадает с ответом исходного сериализатора.
+    Вложенные many=True по связи многие-ко-многим загружаются
+    одним дополнительным запросом на страницу.
+    """
+
+    def __init__(self, serializer, prefix=''):
+        self.model = serializer.Meta.model
+        self.prefix = prefix
+        self.columns = []
+        self.accessors = []
+        self.nested_many = []
+        for name, field in serializer.fields.items():
+            self.accessors.append((name, self.compile_field(
+                serializer, name, field
+            )))
+
+    @classmethod
+    @lru_cache(maxsize=SERIALIZER_CACHE_SIZE)
+    def for_serializer(cls, serializer_class, fields=None):
+        """
+        Сериализатор для класса и набора полей с кэшем по ним.
+        fields — кортеж без повторов в порядке Meta.fields, иначе
+        каждая перестановка параметра запроса займёт свою запись.
+        """
+        kwargs = {} if fields is None else {'fields': fields}
+        return cls(serializer_class(**kwargs))
+
+    def add_column(self, column):
+        column = self.prefix + column
+        self.columns.append(column)
+        return column
+
+    def compile_field(self, serializer, name, field):
+        source = field.source
+        if isinstance(field, serializers.ListSerializer):
+            model_field = self.model._meta.get_field(source)
+            if not model_field.many_to_many:
+                raise ImproperlyConfigured(UNSUPPORTED_FIELD_ERROR.format(
+                    field=name, serializer=type(serializer).__name__
+                ))
+            nested = ValuesSerializer(
+                field.child, f'{model_field.m2m_reverse_field_name()}__'
+            )
+            self.nested_many.append((name, model_field, nested))
+            return None
+        if isinstance(field, serializers.ModelSerializer):
+            key = itemgetter(self.add_column(f'{source}_id'))
+            nested = ValuesSerializer(field, f'{self.prefix}{source}__')
+            self.columns.extend(nested.columns)
+
+            def get_nested(row):
+                return None if key(row) is None else nested.build(row)
+
+            return get_nested
+        if hasattr(field, 'value_fields'):
+            columns = [
+                self.add_column(column) for column in field.value_fields
+            ]
+            from_values = field.from_values
+            return lambda row: from_values([row[key] for key in columns])
+        if isinstance(field, serializers.SlugRelatedField):
+            return itemgetter(
+                self.add_column(f'{source}__{field.slug_field}')
+            )
+        try:
+            model_field = self.model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise ImproperlyConfigured(UNSUPPORTED_FIELD_ERROR.format(
+                field=name, serializer=type(serializer).__name__
+            ))
+        key = itemgetter(self.add_column(model_field.attname))
+        convert = compile_converter(field, model_field)
+        if convert is None:
+            return key
+        return lambda row: convert(key(row))
+
+    def build(self, row):
+        return {
+            name: accessor(row)
+            for name, accessor in self.accessors
+            if accessor is not None
+        }
+
+    def get_queryset(self, queryset, extra_columns=()):
+        """Выборка столбцов для build(); extra_columns — ключ сортировки."""
+        columns = list(dict.fromkeys(
+            ['pk', *self.columns, *extra_columns]
+        ))
+        return queryset.select_related(None).prefetch_related(None).values(
+            *columns
+        )
+
+    def load_nested_many(self, rows):
+        nested_rows = {}
+        if not rows:
+            return nested_rows
+        pks = [row['pk'] for row in rows]
+        for name, model_field, nested in self.nested_many:
+            owner = model_field.m2m_field_name()
+            target = model_field.m2m_reverse_field_name()
+            ordering = []
+            for field in model_field.related_model._meta.ordering:
+                sign = '-' if field.startswith('-') else ''
+                ordering.append(f"{sign}{target}__{field.lstrip('-')}")
+            items = {pk: [] for pk in pks}
+            for item in model_field.remote_field.through.objects.filter(
+                **{f'{owner}_id__in': pks}
+            ).order_by(*ordering).values(f'{owner}_id', *nested.columns):
+                items[item[f'{owner}_id']].append(nested.build(item))
+            nested_rows[name] = items
+        return nested_rows
+
+    def serialize(self, rows, nested_rows=None):
+        """
+        Строит ответ по строкам из get_queryset(); nested_rows
+        можно загрузить заранее через load_nested_many().
+        """
+        rows = list(rows)
+        if nested_rows is None:
+            nested_rows = self.load_nested_many(rows)
+        data = []
+        for row in rows:
+            item = {}
+            for name, accessor in self.accessors:
+                if accessor is None:
+                    item[name] = nested_rows[name][row['pk']]
+                else:
+                    item[name] = accessor(row)
+            data.append(item)
+        return data
+
+    def serialize_top(self, queryset, partition, ordering, limit):
+        """
+        Первые limit объектов queryset в каждой группе по полю partition
+        в порядке ordering. Номера строк в группах считает
+        ROW_NUMBER() OVER (PARTITION BY ...) во вложенном запросе,
+        поэтому выборка для любого числа групп — один запрос.
+        Возвращает словарь {значение partition: [данные объектов]}.
+        """
+        ranked = queryset.order_by().annotate(row_number=Window(
+            RowNumber(),
+            partition_by=[F(partition)],
+            order_by=[
+                F(field.lstrip('-')).desc() if field.startswith('-')
+                else F(field).asc()
+                for field in ordering
+            ],
+        )).values('pk', 'row_number')
+        sql, params = ranked.query.sql_with_params()
+        pk = connections[queryset.db].ops.quote_name(
+            self.model._meta.pk.column
+        )
+        rows = list(self.get_queryset(
+            self.model._default_manager.filter(pk__in=RawSQL(
+                f'SELECT {pk} FROM ({sql}) WHERE "row_number" <= %s',
+                (*params, limit),
+            )).order_by(partition, *ordering),
+            [partition],
+        ))
+        nested_rows = self.load_nested_many(rows)
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(row[partition], []).append(row)
+        return {
+            key: self.serialize(group, nested_rows)
+            for key, group in grouped.items()
+        }
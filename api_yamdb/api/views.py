@@ -1,7 +1,9 @@
 import random
+import time
+from functools import partial
 
-from django.db import IntegrityError
-from django.db.models import Avg
+from django.db import IntegrityError, transaction
+from django.db.models import CharField, F, IntegerField, Value
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, permissions, status, viewsets
@@ -12,20 +14,38 @@ from rest_framework_simplejwt.tokens import AccessToken
 
 import api.constants as const
 from api_yamdb import settings
+from reviews.bulk import import_reviews
 from reviews.constants import PROFILE_URL_NAME
-from reviews.models import User, Category, Genre, Title, Review
-from .filters import TitleFilter
+from reviews.models import User, Category, Comment, Genre, Title, Review
+from reviews.purge import count_user_content, iter_purge_user_content
+from reviews.search import COMMENT_SEARCH_INDEX, REVIEW_SEARCH_INDEX
+from .cache import (
+    COMMENTS_STAMP, REVIEWS_STAMP, TAXONOMY_STAMP, TITLE_STAMP, TITLES_STAMP,
+    USERS_STAMP, get_cache_stats
+)
+from .export import EXPORT_FORMATS, get_export_response, iter_chunks
+from .filters import (
+    StoredOrderingFilter, TitleFilter, TitleMatchFilter, count_title_facets
+)
+from .mixins import (
+    CachedResponseMixin, ConditionalGetMixin, IncludeMixin, ValuesListMixin
+)
+from .pagination import ActivityPagination, FeedPagination, TitlePagination
+from .values_serializers import ValuesSerializer
 from .permissions import (
     AdminOnlyPermission,
     AdminOrSafeMethodPermission,
     IsAuthorModeratorAdminOrReadOnly,
+    ModeratorOrAdminPermission,
 )
 from .serializers import (
+    ActivitySerializer,
     CategorySerializer,
     CommentSerializer,
     GenreSerializer,
     GetTokenSerializer,
     ReviewSerializer,
+    TextSearchHitSerializer,
     TitleReadSerializer,
     TitleCreateUpdateSerializer,
     UserRegistrationSerializer,
@@ -69,6 +89,92 @@ class UserViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK
         )
 
+    @action(
+        detail=True,
+        permission_classes=(permissions.AllowAny,),
+        pagination_class=ActivityPagination,
+    )
+    def activity(self, request, username=None):
+        """Отзывы и комментарии пользователя от новых к старым."""
+        return self.get_activity_response(self.get_object().pk)
+
+    @action(
+        url_path=f'{PROFILE_URL_NAME}/activity',
+        detail=False,
+        permission_classes=(permissions.IsAuthenticated,),
+        pagination_class=ActivityPagination,
+    )
+    def profile_activity(self, request):
+        """Отзывы и комментарии текущего пользователя."""
+        return self.get_activity_response(request.user.pk)
+
+    def get_activity_querysets(self, user_id):
+        """
+        Отзывы и комментарии автора для UNION ALL;
+        каждая часть читает индекс (author, pub_date, id).
+        """
+        return get_text_items(
+            Review.objects.filter(author_id=user_id),
+            Comment.objects.filter(author_id=user_id),
+            const.ACTIVITY_COLUMNS,
+        )
+
+    def get_activity_response(self, user_id):
+        page = self.paginate_queryset(
+            list(self.get_activity_querysets(user_id).values())
+        )
+        return self.get_paginated_response(
+            ActivitySerializer(page, many=True).data
+        )
+
+    @action(
+        methods=['POST'],
+        detail=True,
+        permission_classes=(ModeratorOrAdminPermission,),
+    )
+    def purge(self, request, username=None):
+        """
+        Удаление отзывов и комментариев пользователя пачками,
+        не дольше PURGE_REQUEST_BUDGET секунд за запрос. Пока done
+        равно false, запрос нужно повторять.
+        """
+        user = self.get_object()
+        deadline = time.monotonic() + settings.PURGE_REQUEST_BUDGET
+        deleted = {'comments': 0, 'reviews': 0}
+        for progress in iter_purge_user_content(user.pk):
+            deleted = {kind: progress[kind] for kind in deleted}
+            if time.monotonic() > deadline:
+                break
+        remaining = count_user_content(user.pk)
+        return Response(
+            {
+                'deleted': deleted,
+                'remaining': remaining,
+                'done': not any(remaining.values()),
+            },
+            status=status.HTTP_200_OK
+        )
+
+
+def get_text_items(reviews, comments, columns):
+    """
+    Отзывы и комментарии с одинаковыми столбцами columns для UNION ALL
+    в словаре {тип записи: выборка}: kind — тип записи,
+    parent_review — отзыв комментария, review_score — оценка отзыва.
+    """
+    return {
+        'review': reviews.order_by().annotate(
+            kind=Value('review', CharField()),
+            parent_review=Value(None, IntegerField()),
+            review_score=F('score'),
+        ).values(*columns),
+        'comment': comments.order_by().annotate(
+            kind=Value('comment', CharField()),
+            parent_review=F('review_id'),
+            review_score=Value(None, IntegerField()),
+        ).values(*columns),
+    }
+
 
 def get_confirmation_code():
     return (''.join(random.choices(
@@ -127,7 +233,36 @@ def get_user_token(request):
     )
 
 
+@api_view(['POST'])
+@permission_classes([AdminOnlyPermission], )
+def bulk_create_reviews(request):
+    """
+    Массовая загрузка отзывов администратором: список объектов
+    с полями title, author (username), score, text и необязательным
+    pub_date. В ответе результат по каждой строке в порядке запроса.
+    """
+    rows = request.data
+    if (
+        not isinstance(rows, list)
+        or len(rows) > const.BULK_REVIEWS_MAX_SIZE
+    ):
+        raise ValidationError(const.BULK_REVIEWS_PAYLOAD_ERROR.format(
+            max_size=const.BULK_REVIEWS_MAX_SIZE
+        ))
+    results = import_reviews(rows)
+    created = sum('id' in result for result in results)
+    return Response(
+        {
+            'created': created,
+            'failed': len(results) - created,
+            'results': results,
+        },
+        status=status.HTTP_200_OK
+    )
+
+
 class ContentGroupsViewSet(
+    ValuesListMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
     mixins.UpdateModelMixin,
@@ -155,14 +290,23 @@ class CategoryViewSet(ContentGroupsViewSet):
     serializer_class = CategorySerializer
 
 
-class TitleViewSet(viewsets.ModelViewSet):
+class TitleViewSet(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    IncludeMixin,
+    ValuesListMixin,
+    viewsets.ModelViewSet
+):
     """Представление для работы с произведениями."""
-    queryset = Title.objects.annotate(
-        rating=Avg('reviews__score')
+    queryset = Title.objects.select_related('category').prefetch_related(
+        'genre'
     ).order_by(*Title._meta.ordering)
     permission_classes = (AdminOrSafeMethodPermission,)
-    filter_backends = (DjangoFilterBackend,)
-    filterset_class = TitleFilter
+    filter_backends = (DjangoFilterBackend, StoredOrderingFilter)
+    ordering_fields = const.TITLE_ORDERING_FIELDS
+    pagination_class = TitlePagination
+    includes = ('latest_reviews',)
+    include_actions = ('retrieve',)
     http_method_names = const.ALLOWED_HTTP_METHODS
 
     def get_serializer_class(self):
@@ -170,44 +314,355 @@ class TitleViewSet(viewsets.ModelViewSet):
             return TitleReadSerializer
         return TitleCreateUpdateSerializer
 
+    @property
+    def filterset_class(self):
+        """Поиск ранжируется только в списке произведений."""
+        if self.action == 'list':
+            return TitleFilter
+        return TitleMatchFilter
+
+    def get_requested_fields(self):
+        """
+        Поля из параметра fields без повторов в порядке Meta.fields
+        сериализатора; None, если параметр не передан.
+        """
+        if self.action not in ('list', 'retrieve'):
+            return None
+        value = self.request.query_params.get('fields')
+        if not value:
+            return None
+        fields = [field for field in value.split(',') if field]
+        allowed = TitleReadSerializer.Meta.fields
+        unknown = set(fields) - set(allowed)
+        if unknown:
+            raise ValidationError({
+                'fields': const.UNKNOWN_FIELDS_ERROR.format(
+                    fields=', '.join(sorted(unknown)),
+                    allowed=', '.join(allowed),
+                )
+            })
+        return [field for field in allowed if field in fields]
+
+    def get_queryset(self):
+        """
+        Для ответа с частью полей загружает только нужные столбцы
+        и не подтягивает жанры и категорию, если они не запрошены.
+        Столбцы ключа сортировки загружаются всегда.
+        """
+        queryset = super().get_queryset()
+        fields = self.get_requested_fields()
+        if fields is None:
+            return queryset
+        columns = {'id', 'category', 'name'}
+        declared = TitleReadSerializer._declared_fields
+        for field in fields:
+            if field not in ('genre', 'category'):
+                columns.update(getattr(
+                    declared.get(field), 'value_fields', (field,)
+                ))
+        if 'category' in fields:
+            columns.update(('category__name', 'category__slug'))
+        else:
+            queryset = queryset.select_related(None)
+        if 'genre' not in fields:
+            queryset = queryset.prefetch_related(None)
+        return queryset.only(*columns)
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        if const.TITLE_IDS_PARAM in request.query_params:
+            return self.get_conditional_response(
+                partial(self.get_cached_response, self.get_batch_response),
+                request
+            )
+        return super().list(request, *args, **kwargs)
+
+    def get_requested_ids(self):
+        """Уникальные id из параметра ids в порядке запроса."""
+        value = self.request.query_params[const.TITLE_IDS_PARAM]
+        try:
+            ids = list(dict.fromkeys(
+                int(pk) for pk in value.split(',') if pk.strip()
+            ))
+        except ValueError:
+            raise ValidationError({
+                const.TITLE_IDS_PARAM: const.INVALID_IDS_ERROR
+            })
+        if not ids or min(ids) < 1:
+            raise ValidationError({
+                const.TITLE_IDS_PARAM: const.INVALID_IDS_ERROR
+            })
+        if len(ids) > const.TITLE_BATCH_MAX_SIZE:
+            raise ValidationError({
+                const.TITLE_IDS_PARAM: const.TOO_MANY_IDS_ERROR.format(
+                    max_size=const.TITLE_BATCH_MAX_SIZE
+                )
+            })
+        return ids
 
-class ReviewViewSet(viewsets.ModelViewSet):
+    def get_batch_response(self, request):
+        """
+        Произведения по списку id без пагинации, в порядке запроса:
+        один запрос произведений с категориями и один — жанров
+        при любой длине списка. Ненайденные id перечисляются в missing.
+        """
+        ids = self.get_requested_ids()
+        serializer = self.get_values_serializer()
+        rows = {
+            row['pk']: row for row in serializer.get_queryset(
+                self.get_queryset().filter(pk__in=ids)
+            )
+        }
+        return Response({
+            'results': serializer.serialize(
+                rows[pk] for pk in ids if pk in rows
+            ),
+            'missing': [pk for pk in ids if pk not in rows],
+        })
+
+    @action(detail=False)
+    def facets(self, request):
+        """Количество произведений по жанрам, категориям и годам."""
+        return self.get_conditional_response(
+            partial(self.get_cached_response, self.get_facets_response),
+            request
+        )
+
+    @action(
+        detail=False,
+        url_path='cache-stats',
+        permission_classes=(AdminOnlyPermission,),
+    )
+    def cache_stats(self, request):
+        """Счётчики попаданий и промахов кэша ответов каталога."""
+        return Response(get_cache_stats())
+
+    @action(detail=False, permission_classes=(AdminOnlyPermission,))
+    def export(self, request):
+        """
+        Потоковая выгрузка всех произведений (с учётом фильтров)
+        в NDJSON или CSV, в порядке id.
+        """
+        export_format = request.query_params.get(
+            const.EXPORT_FORMAT_PARAM, 'ndjson'
+        )
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({
+                const.EXPORT_FORMAT_PARAM:
+                    const.UNKNOWN_EXPORT_FORMAT_ERROR.format(
+                        output=export_format,
+                        allowed=', '.join(EXPORT_FORMATS),
+                    )
+            })
+        chunks = iter_chunks(
+            ValuesSerializer.for_serializer(TitleReadSerializer),
+            self.filter_queryset(self.get_queryset()).order_by('id'),
+            const.EXPORT_CHUNK_SIZE,
+        )
+        return get_export_response(request, chunks, export_format, 'titles')
+
+    def get_facets_response(self, request):
+        facets = [
+            facet for facet in request.query_params.get(
+                'facets', ','.join(const.TITLE_FACETS)
+            ).split(',') if facet
+        ]
+        unknown = set(facets) - set(const.TITLE_FACETS)
+        if unknown:
+            raise ValidationError({
+                'facets': const.UNKNOWN_FACETS_ERROR.format(
+                    facets=', '.join(sorted(unknown)),
+                    allowed=', '.join(const.TITLE_FACETS),
+                )
+            })
+        return Response(count_title_facets(
+            self.filter_queryset(self.get_queryset()), facets
+        ))
+
+    def include_latest_reviews(self, ids, limit):
+        """Последние отзывы произведений, limit на каждое."""
+        return ValuesSerializer.for_serializer(ReviewSerializer).serialize_top(
+            Review.objects.filter(title_id__in=ids), 'title_id',
+            const.FEED_ORDERING, limit,
+        )
+
+    def get_cache_stamps(self):
+        if self.action == 'retrieve':
+            stamps = (
+                TITLE_STAMP.format(pk=self.kwargs['pk']), TAXONOMY_STAMP
+            )
+            if 'latest_reviews' in self.get_includes():
+                stamps += (
+                    REVIEWS_STAMP.format(title_id=self.kwargs['pk']),
+                    USERS_STAMP,
+                )
+            return stamps
+        return (TITLES_STAMP,)
+
+
+class TextSearchViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Полнотекстовый поиск модератора по текстам отзывов и комментариев:
+    совпадения из обоих индексов FTS5 объединяются и сортируются
+    по релевантности. Параметр type ограничивает поиск одним типом.
+    """
+    serializer_class = TextSearchHitSerializer
+    permission_classes = (ModeratorOrAdminPermission,)
+
+    def get_queryset(self):
+        params = self.request.query_params
+        text = params.get(const.TEXT_SEARCH_PARAM, '').strip()
+        if not text:
+            raise ValidationError({
+                const.TEXT_SEARCH_PARAM: const.TEXT_SEARCH_REQUIRED_ERROR
+            })
+        kinds = [
+            kind for kind in params.get(
+                const.TEXT_SEARCH_TYPE_PARAM, ''
+            ).split(',') if kind
+        ] or const.TEXT_SEARCH_TYPES
+        unknown = set(kinds) - set(const.TEXT_SEARCH_TYPES)
+        if unknown:
+            raise ValidationError({
+                const.TEXT_SEARCH_TYPE_PARAM:
+                    const.UNKNOWN_TEXT_SEARCH_TYPE_ERROR.format(
+                        type=', '.join(sorted(unknown)),
+                        allowed=', '.join(const.TEXT_SEARCH_TYPES),
+                    )
+            })
+        items = get_text_items(
+            REVIEW_SEARCH_INDEX.search(
+                Review.objects.all(), text, ('text',)
+            ),
+            COMMENT_SEARCH_INDEX.search(
+                Comment.objects.all(), text, ('text',)
+            ),
+            const.TEXT_SEARCH_COLUMNS,
+        )
+        first, *rest = (items[kind] for kind in dict.fromkeys(kinds))
+        return first.union(*rest, all=True).order_by(
+            *const.TEXT_SEARCH_ORDERING
+        )
+
+
+class FeedViewSet(
+    ConditionalGetMixin, IncludeMixin, ValuesListMixin, viewsets.ModelViewSet
+):
+    """
+    Базовое представление для лент отзывов и комментариев,
+    вложенных в родительский объект из URL.
+    """
+    permission_classes = [IsAuthorModeratorAdminOrReadOnly]
+    pagination_class = FeedPagination
+    http_method_names = const.ALLOWED_HTTP_METHODS
+
+    # Родительский объект из URL: выборка и соответствие
+    # {поле родителя: аргумент URL}.
+    parent_queryset = None
+    parent_lookups = {}
+
+    def get_parent(self):
+        """Родительский объект из URL, загружается один раз за запрос."""
+        if not hasattr(self, '_parent'):
+            self._parent = get_object_or_404(self.parent_queryset, **{
+                field: self.kwargs[kwarg]
+                for field, kwarg in self.parent_lookups.items()
+            })
+        return self._parent
+
+    def paginate_queryset(self, queryset):
+        """
+        Пустая страница может означать несуществующего родителя:
+        только в этом случае он проверяется отдельным запросом.
+        """
+        page = super().paginate_queryset(queryset)
+        if not page:
+            self.get_parent()
+        return page
+
+
+class ReviewViewSet(FeedViewSet):
     """
     Представление для реализации операций
     для модели отзывов на произведени.
     """
     serializer_class = ReviewSerializer
-    permission_classes = [IsAuthorModeratorAdminOrReadOnly]
-    http_method_names = const.ALLOWED_HTTP_METHODS
+    # Штамп отзывов произведения сдвигается и при изменении
+    # комментариев, поэтому покрывает и встроенные комментарии.
+    cache_stamps = (REVIEWS_STAMP, USERS_STAMP)
+    parent_queryset = Title.objects.all()
+    parent_lookups = {'pk': 'title_id'}
+    includes = ('comments',)
+    include_actions = ('list', 'retrieve')
 
-    def get_title(self):
-        return get_object_or_404(Title, pk=self.kwargs['title_id'])
+    def include_comments(self, ids, limit):
+        """Последние комментарии отзывов, limit на каждый."""
+        return ValuesSerializer.for_serializer(
+            CommentSerializer
+        ).serialize_top(
+            Comment.objects.filter(
+                title_id=self.kwargs['title_id'], review_id__in=ids
+            ),
+            'review_id', const.FEED_ORDERING, limit,
+        )
 
     def get_queryset(self):
-        return self.get_title().reviews.all()
+        """
+        Отзывы отбираются по title_id из URL без загрузки произведения:
+        для отдельного отзыва несуществующее произведение даёт 404
+        в том же запросе, для списка оно проверяется только
+        при пустой странице (см. paginate_queryset).
+        """
+        return Review.objects.filter(
+            title_id=self.kwargs['title_id']
+        ).select_related('author')
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user, title=self.get_title())
+        """
+        Повторный отзыв отсекает ограничение уникальности
+        unique_review_per_title_per_user, а не предварительная проверка:
+        так нет лишнего запроса и гонки параллельных запросов.
+        Вставка идёт в точке сохранения, чтобы ошибка не прерывала
+        внешнюю транзакцию.
+        """
+        title = self.get_parent()
+        try:
+            with transaction.atomic():
+                serializer.save(author=self.request.user, title=title)
+        except IntegrityError:
+            raise ValidationError(const.REVIEW_VALIDATE_ERROR)
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(FeedViewSet):
     """
     Представление для реализации операций
     для модели комментариев к отзывам на произведения.
     """
     serializer_class = CommentSerializer
-    permission_classes = [IsAuthorModeratorAdminOrReadOnly]
-    http_method_names = const.ALLOWED_HTTP_METHODS
-
-    def get_review(self):
-        return get_object_or_404(Review, pk=self.kwargs['review_id'])
+    cache_stamps = (COMMENTS_STAMP, USERS_STAMP)
+    # Отзыв ищется сразу по review_id и title_id одним запросом
+    # и только с нужными столбцами: отзыв чужого произведения даёт 404.
+    parent_queryset = Review.objects.only('id', 'title_id')
+    parent_lookups = {'pk': 'review_id', 'title_id': 'title_id'}
 
     def get_queryset(self):
-        return self.get_review().comments.all()
+        """
+        Комментарии отбираются по денормализованному Comment.title
+        и review_id из URL без загрузки отзыва; несовпадающие
+        id произведения и отзыва дают пустую выборку.
+        """
+        return Comment.objects.filter(
+            title_id=self.kwargs['title_id'],
+            review_id=self.kwargs['review_id'],
+        ).select_related('author')
 
     def perform_create(self, serializer):
-        review = self.get_review()
+        review = self.get_parent()
         serializer.save(
             author=self.request.user,
             review=review,
-            title=review.title)
+            title_id=review.title_id,
+        )
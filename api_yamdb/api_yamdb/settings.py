@@ -59,6 +59,38 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'stamps': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'stamps',
+    },
+}
+
+# Штампы версий данных должны быть общими для всех процессов
+# сервера: при кэше в памяти процесса (locmem) кэширование ответов
+# и условные запросы отключаются. Файловый кэш общий только для
+# процессов одного хоста, для нескольких хостов нужен общий бэкенд.
+VERSION_STAMP_CACHE = 'stamps'
+
+RESPONSE_CACHE_TIMEOUT = 60 * 5
+
+# Байесовский рейтинг: оценки произведения дополняются
+# RATING_PRIOR_WEIGHT условными отзывами со средней оценкой
+# RATING_PRIOR_MEAN. После изменения — recalculate_ratings.
+RATING_PRIOR_MEAN = 5.5
+RATING_PRIOR_WEIGHT = 10
+
+# Удаление материалов пользователя идёт пачками не больше
+# PURGE_BATCH_SIZE строк; пачка уменьшается, если её транзакция
+# держит блокировку записи дольше PURGE_LOCK_BUDGET секунд.
+# Запрос к API удаляет пачки не дольше PURGE_REQUEST_BUDGET секунд.
+PURGE_BATCH_SIZE = 500
+PURGE_LOCK_BUDGET = 0.2
+PURGE_REQUEST_BUDGET = 5
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
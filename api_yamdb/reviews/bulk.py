@@ -0,0 +1,215 @@
+from collections import Counter, defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.dispatch import Signal
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+import reviews.constants as const
+from .models import Review, Title, User
+from .ratings import shift_title_scores, title_aggregates_changed
+from .validators import validate_score
+
+BULK_REVIEW_FIELDS = ('title', 'author', 'score', 'text')
+
+# Отправляется после массовой загрузки отзывов в обход сигналов
+# моделей, аргумент title_ids — id произведений с новыми отзывами.
+reviews_imported = Signal()
+
+
+def is_integer(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def parse_pub_date(value):
+    """Дата из строки ISO 8601; без часового пояса — в TIME_ZONE."""
+    try:
+        pub_date = parse_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if pub_date is not None and timezone.is_naive(pub_date):
+        pub_date = timezone.make_aware(pub_date)
+    return pub_date
+
+
+def parse_review_row(row):
+    """
+    Проверяет типы полей строки загрузки.
+    Возвращает словарь значений и словарь ошибок по полям.
+    """
+    if not isinstance(row, dict):
+        return None, {'non_field_errors': [const.BULK_ROW_TYPE_ERROR]}
+    errors = {}
+    for field in BULK_REVIEW_FIELDS:
+        if row.get(field) in (None, ''):
+            errors[field] = [const.BULK_REQUIRED_FIELD_ERROR]
+    for field, is_valid in (
+        ('title', is_integer),
+        ('score', is_integer),
+        ('author', lambda value: isinstance(value, str)),
+        ('text', lambda value: isinstance(value, str)),
+    ):
+        if field not in errors and not is_valid(row[field]):
+            errors[field] = [
+                const.BULK_INVALID_FIELD_ERROR.format(value=row[field])
+            ]
+    pub_date = row.get('pub_date')
+    if pub_date is not None:
+        pub_date = parse_pub_date(pub_date)
+        if pub_date is None:
+            errors['pub_date'] = [const.BULK_INVALID_FIELD_ERROR.format(
+                value=row['pub_date']
+            )]
+    if errors:
+        return None, errors
+    return {
+        'title_id': row['title'],
+        'username': row['author'],
+        'score': row['score'],
+        'text': row['text'],
+        'pub_date': pub_date,
+    }, errors
+
+
+def import_reviews(rows, chunk_size=const.BULK_REVIEWS_CHUNK_SIZE):
+    """
+    Массовая загрузка отзывов. Строки проверяются целиком до записи:
+    оценки — одним проходом validate_score, произведения, авторы
+    и уже существующие отзывы — одним запросом на пачку.
+    Каждая пачка вставляется bulk_create в своей транзакции
+    вместе с приращением агрегатов рейтинга её произведений,
+    поэтому сбой между пачками не оставляет неучтённых оценок.
+    Возвращает результаты в порядке строк: {'id': ...} для
+    созданного отзыва или {'errors': {...}} для отклонённой строки.
+    """
+    results = [None] * len(rows)
+    parsed = []
+    for index, row in enumerate(rows):
+        data, errors = parse_review_row(row)
+        if errors:
+            results[index] = {'errors': errors}
+        else:
+            parsed.append((index, data))
+    valid = []
+    for index, data in parsed:
+        try:
+            validate_score(data['score'])
+        except ValidationError as error:
+            results[index] = {'errors': {'score': error.messages}}
+        else:
+            valid.append((index, data))
+    seen = set()
+    title_ids = set()
+    for start in range(0, len(valid), chunk_size):
+        chunk = import_chunk(valid[start:start + chunk_size], results, seen)
+        title_ids.update(chunk)
+    if title_ids:
+        title_ids = sorted(title_ids)
+        title_aggregates_changed.send(sender=Title, title_ids=title_ids)
+        reviews_imported.send(sender=Review, title_ids=title_ids)
+    return results
+
+
+def import_chunk(chunk, results, seen):
+    """
+    Проверяет связи пачки строк и вставляет её отзывы.
+    seen — пары (произведение, автор), уже занятые отзывами,
+    пополняется существующими и вставляемыми отзывами пачки.
+    Возвращает id произведений с новыми отзывами.
+    """
+    titles = set(Title.objects.filter(
+        pk__in={data['title_id'] for _, data in chunk}
+    ).values_list('id', flat=True))
+    authors = dict(User.objects.filter(
+        username__in={data['username'] for _, data in chunk}
+    ).values_list('username', 'id'))
+    seen.update(Review.objects.filter(
+        title_id__in=titles, author_id__in=authors.values()
+    ).values_list('title_id', 'author_id'))
+    reviews = []
+    for index, data in chunk:
+        errors = check_relations(data, titles, authors, seen)
+        seen.add((data['title_id'], authors.get(data['username'])))
+        if errors:
+            results[index] = {'errors': errors}
+            continue
+        reviews.append((index, data['pub_date'], Review(
+            title_id=data['title_id'],
+            author_id=authors[data['username']],
+            score=data['score'],
+            text=data['text'],
+        )))
+    if not reviews:
+        return set()
+    try:
+        with transaction.atomic():
+            save_chunk(reviews)
+    except IntegrityError:
+        for index, _, _ in reviews:
+            results[index] = {
+                'errors': {'non_field_errors': [const.BULK_CONFLICT_ERROR]}
+            }
+        return set()
+    for index, _, review in reviews:
+        results[index] = {'id': review.pk}
+    return {review.title_id for _, _, review in reviews}
+
+
+def check_relations(data, titles, authors, taken):
+    """Ошибки ссылок строки на произведение и автора и повтора отзыва."""
+    errors = {}
+    if data['title_id'] not in titles:
+        errors['title'] = [const.BULK_TITLE_NOT_FOUND_ERROR.format(
+            title=data['title_id']
+        )]
+    if data['username'] not in authors:
+        errors['author'] = [const.BULK_AUTHOR_NOT_FOUND_ERROR.format(
+            author=data['username']
+        )]
+    if (
+        not errors
+        and (data['title_id'], authors[data['username']]) in taken
+    ):
+        errors['non_field_errors'] = [
+            const.BULK_DUPLICATE_REVIEW_ERROR.format(
+                author=data['username'], title=data['title_id']
+            )
+        ]
+    return errors
+
+
+def save_chunk(reviews):
+    """
+    Вставляет отзывы одним bulk_create. SQLite не возвращает
+    id вставленных строк, поэтому они читаются по уникальной паре
+    (произведение, автор); pub_date с auto_now_add записывается
+    отдельным bulk_update для строк, где дата передана.
+    Оценки прибавляются к агрегатам произведений F()-выражениями:
+    по одному UPDATE на группу произведений с одинаковым набором
+    новых оценок.
+    """
+    objects = [review for _, _, review in reviews]
+    Review.objects.bulk_create(objects)
+    title_scores = defaultdict(Counter)
+    for review in objects:
+        title_scores[review.title_id][review.score] += 1
+    titles_by_scores = defaultdict(list)
+    for title_id, scores in title_scores.items():
+        titles_by_scores[tuple(sorted(scores.items()))].append(title_id)
+    for scores, title_ids in titles_by_scores.items():
+        shift_title_scores(title_ids, dict(scores))
+    ids = {
+        (title_id, author_id): pk
+        for title_id, author_id, pk in Review.objects.filter(
+            title_id__in={review.title_id for review in objects},
+            author_id__in={review.author_id for review in objects},
+        ).values_list('title_id', 'author_id', 'id')
+    }
+    dated = []
+    for _, pub_date, review in reviews:
+        review.pk = ids[(review.title_id, review.author_id)]
+        if pub_date is not None:
+            review.pub_date = pub_date
+            dated.append(review)
+    Review.objects.bulk_update(dated, ['pub_date'])
@@ -4,6 +4,13 @@ MAX_LENGTH_NAME = 256
 MAX_LENGTH_SLUG = 50
 MIN_SCORE = 1
 MAX_SCORE = 10
+SCORE_RANGE = range(MIN_SCORE, MAX_SCORE + 1)
+SCORE_COUNT_FIELD = 'score_{score}_count'
+SCORE_COUNT_FIELDS = tuple(
+    SCORE_COUNT_FIELD.format(score=score) for score in SCORE_RANGE
+)
+SCORE_PERCENTILES = (25, 50, 75, 90)
+BULK_REVIEWS_CHUNK_SIZE = 500
 USERNAME_REGEX = r'[\w.@+-]'
 ADMIN = 'admin'
 MODERATOR = 'moderator'
@@ -23,3 +30,25 @@ REVIEW_SCORE_ERROR = (
     'Оценка не может иметь значение {score}, '
     'допустимые значения от {min} до {max}.'
 )
+BULK_ROW_TYPE_ERROR = (
+    'Ожидается объект с полями title, author, score, text и pub_date.'
+)
+BULK_REQUIRED_FIELD_ERROR = (
+    'Обязательное поле.'
+)
+BULK_INVALID_FIELD_ERROR = (
+    'Некорректное значение: {value}.'
+)
+BULK_TITLE_NOT_FOUND_ERROR = (
+    'Произведение {title} не найдено.'
+)
+BULK_AUTHOR_NOT_FOUND_ERROR = (
+    'Пользователь {author} не найден.'
+)
+BULK_DUPLICATE_REVIEW_ERROR = (
+    'Пользователь {author} уже оставил отзыв на произведение {title}.'
+)
+BULK_CONFLICT_ERROR = (
+    'Отзывы этой пачки не сохранены из-за параллельного изменения, '
+    'повторите загрузку.'
+)
@@ -0,0 +1,54 @@
+from django.db import transaction
+from django.db.models import Count, F
+from django.dispatch import Signal
+
+from .models import Comment, Review
+
+# Отправляется после массового изменения счётчиков комментариев
+# в обход сигналов моделей, аргумент title_ids — id произведений,
+# к которым относятся затронутые отзывы.
+review_aggregates_changed = Signal()
+
+
+def shift_comment_count(review_id, delta):
+    """Атомарно сдвигает счётчик комментариев отзыва одним UPDATE."""
+    Review.objects.filter(pk=review_id).update(
+        comment_count=F('comment_count') + delta
+    )
+
+
+def recalculate_comment_counts(review_ids=None):
+    """
+    Пересчитывает счётчики комментариев по таблице комментариев
+    одним сгруппированным запросом.
+    Без review_ids пересчитываются все отзывы.
+    Возвращает количество обновлённых отзывов.
+    """
+    reviews = Review.objects.all()
+    comments = Comment.objects.all()
+    if review_ids is not None:
+        reviews = reviews.filter(pk__in=review_ids)
+        comments = comments.filter(review_id__in=review_ids)
+    counts = dict(
+        comments.order_by().values('review_id').annotate(
+            count=Count('id')
+        ).values_list('review_id', 'count')
+    )
+    changed = []
+    for review in reviews.only(
+        'id', 'title_id', 'comment_count'
+    ).iterator(chunk_size=2000):
+        comment_count = counts.get(review.pk, 0)
+        if review.comment_count != comment_count:
+            review.comment_count = comment_count
+            changed.append(review)
+    with transaction.atomic():
+        Review.objects.bulk_update(
+            changed, ('comment_count',), batch_size=500
+        )
+    if changed:
+        review_aggregates_changed.send(
+            sender=Review,
+            title_ids=list({review.title_id for review in changed}),
+        )
+    return len(changed)
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api_yamdb.settings import PURGE_BATCH_SIZE, PURGE_LOCK_BUDGET
+from reviews.models import User
+from reviews.purge import count_user_content, iter_purge_user_content
+
+HELP = (
+    'Удаление отзывов и комментариев пользователя пачками '
+    'с пересчётом рейтингов и счётчиков после каждой пачки.'
+)
+USER_NOT_FOUND = 'Пользователь {username} не найден.'
+PURGE_START = 'Удаляется комментариев: {comments}, отзывов: {reviews}.'
+PURGE_PROGRESS = (
+    'Удалено комментариев: {comments}, отзывов: {reviews} '
+    '(пачка {batch_size} за {elapsed:.3f} с).'
+)
+PURGE_SUCCESS = 'Материалы пользователя {username} удалены.'
+
+
+class Command(BaseCommand):
+    help = HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', help='Имя пользователя.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=PURGE_BATCH_SIZE,
+            help='Наибольший размер пачки.',
+        )
+        parser.add_argument(
+            '--lock-budget',
+            type=float,
+            default=PURGE_LOCK_BUDGET,
+            help='Наибольшая длительность транзакции пачки, секунды.',
+        )
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=options['username']).first()
+        if user is None:
+            raise CommandError(
+                USER_NOT_FOUND.format(username=options['username'])
+            )
+        self.stdout.write(PURGE_START.format(**count_user_content(user.pk)))
+        for progress in iter_purge_user_content(
+            user.pk, options['batch_size'], options['lock_budget']
+        ):
+            self.stdout.write(PURGE_PROGRESS.format(**progress))
+        self.stdout.write(self.style.SUCCESS(
+            PURGE_SUCCESS.format(username=user.username)
+        ))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from reviews.search import SEARCH_INDEXES
+
+HELP = 'Перестроение полнотекстовых индексов FTS5.'
+INDEX_SUCCESS = 'Индекс {table} перестроен.'
+VENDOR_ERROR = 'Полнотекстовые индексы FTS5 доступны только в SQLite.'
+UNKNOWN_INDEX_ERROR = (
+    'Неизвестные индексы: {tables}. Допустимые значения: {allowed}.'
+)
+
+
+class Command(BaseCommand):
+    help = HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'tables',
+            nargs='*',
+            help='Таблицы индексов; по умолчанию перестраиваются все.',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError(VENDOR_ERROR)
+        indexes = {index.table: index for index in SEARCH_INDEXES}
+        tables = options['tables'] or list(indexes)
+        unknown = set(tables) - set(indexes)
+        if unknown:
+            raise CommandError(UNKNOWN_INDEX_ERROR.format(
+                tables=', '.join(sorted(unknown)),
+                allowed=', '.join(indexes),
+            ))
+        for table in dict.fromkeys(tables):
+            index = indexes[table]
+            with transaction.atomic():
+                index.execute(
+                    index.get_create_sql() + index.get_rebuild_sql()
+                )
+            self.stdout.write(
+                self.style.SUCCESS(INDEX_SUCCESS.format(table=table))
+            )
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from reviews.counters import recalculate_comment_counts
+from reviews.ratings import recalculate_title_ratings
+
+HELP = (
+    'Сверка сохранённых счётчиков с таблицами отзывов и комментариев: '
+    'количество отзывов и агрегаты оценок произведений, '
+    'количество комментариев к отзывам.'
+)
+RECALCULATE_SUCCESS = (
+    'Счётчики сверены, обновлено произведений: {titles}, '
+    'отзывов: {reviews}.'
+)
+
+
+class Command(BaseCommand):
+    help = HELP
+
+    def handle(self, *args, **options):
+        titles = recalculate_title_ratings()
+        reviews = recalculate_comment_counts()
+        self.stdout.write(self.style.SUCCESS(RECALCULATE_SUCCESS.format(
+            titles=titles, reviews=reviews
+        )))
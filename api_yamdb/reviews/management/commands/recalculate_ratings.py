@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from reviews.ratings import recalculate_title_ratings
+
+HELP = 'Пересчёт сохранённых рейтингов произведений по таблице отзывов.'
+RECALCULATE_SUCCESS = 'Рейтинги пересчитаны, обновлено произведений: {count}.'
+
+
+class Command(BaseCommand):
+    help = HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'title_ids',
+            nargs='*',
+            type=int,
+            help='id произведений; по умолчанию пересчитываются все.',
+        )
+
+    def handle(self, *args, **options):
+        count = recalculate_title_ratings(options['title_ids'] or None)
+        self.stdout.write(
+            self.style.SUCCESS(RECALCULATE_SUCCESS.format(count=count))
+        )
@@ -0,0 +1,50 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:57
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def fill_title_rating_aggregates(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Review = apps.get_model('reviews', 'Review')
+    titles = []
+    for row in Review.objects.order_by().values('title_id').annotate(
+        score_sum=Sum('score'), review_count=Count('id')
+    ):
+        titles.append(Title(
+            pk=row['title_id'],
+            score_sum=row['score_sum'],
+            review_count=row['review_count'],
+            rating=row['score_sum'] / row['review_count'],
+        ))
+    Title.objects.bulk_update(
+        titles, ('score_sum', 'review_count', 'rating'), batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0003_auto_20241010_2156'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Рейтинг'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество отзывов'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Сумма оценок'),
+        ),
+        migrations.RunPython(
+            fill_title_rating_aggregates, migrations.RunPython.noop
+        ),
+    ]
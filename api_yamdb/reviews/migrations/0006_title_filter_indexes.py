@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 19:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_title_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['year', 'category', 'name', 'id'], name='title_year_category_name_idx'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+from django.db import migrations
+
+# SQL на момент миграции: она не должна зависеть от того, как позже
+# изменятся токенизатор, столбцы или триггеры в reviews.search.
+CREATE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS reviews_title_fts USING fts5("
+    "name, description, content='reviews_title', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS reviews_title_fts_ai AFTER INSERT "
+    "ON reviews_title BEGIN "
+    "INSERT INTO reviews_title_fts(rowid, name, description) VALUES ("
+    "new.id, replace(replace(new.name, 'ё', 'е'), 'Ё', 'Е'), "
+    "replace(replace(new.description, 'ё', 'е'), 'Ё', 'Е')); END",
+    "CREATE TRIGGER IF NOT EXISTS reviews_title_fts_ad AFTER DELETE "
+    "ON reviews_title BEGIN "
+    "INSERT INTO reviews_title_fts(reviews_title_fts, rowid, name, "
+    "description) VALUES ('delete', old.id, "
+    "replace(replace(old.name, 'ё', 'е'), 'Ё', 'Е'), "
+    "replace(replace(old.description, 'ё', 'е'), 'Ё', 'Е')); END",
+    "CREATE TRIGGER IF NOT EXISTS reviews_title_fts_au AFTER UPDATE "
+    "OF name, description ON reviews_title BEGIN "
+    "INSERT INTO reviews_title_fts(reviews_title_fts, rowid, name, "
+    "description) VALUES ('delete', old.id, "
+    "replace(replace(old.name, 'ё', 'е'), 'Ё', 'Е'), "
+    "replace(replace(old.description, 'ё', 'е'), 'Ё', 'Е')); "
+    "INSERT INTO reviews_title_fts(rowid, name, description) VALUES ("
+    "new.id, replace(replace(new.name, 'ё', 'е'), 'Ё', 'Е'), "
+    "replace(replace(new.description, 'ё', 'е'), 'Ё', 'Е')); END",
+    "INSERT INTO reviews_title_fts(reviews_title_fts) VALUES ('delete-all')",
+    "INSERT INTO reviews_title_fts(rowid, name, description) SELECT id, "
+    "replace(replace(reviews_title.name, 'ё', 'е'), 'Ё', 'Е'), "
+    "replace(replace(reviews_title.description, 'ё', 'е'), 'Ё', 'Е') "
+    "FROM reviews_title",
+    "INSERT INTO reviews_title_fts(reviews_title_fts) VALUES ('optimize')",
+)
+DROP_SQL = (
+    'DROP TRIGGER IF EXISTS reviews_title_fts_ai',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_ad',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_au',
+    'DROP TABLE IF EXISTS reviews_title_fts',
+)
+
+
+def execute(schema_editor, statements):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def create_title_search_index(apps, schema_editor):
+    execute(schema_editor, CREATE_SQL)
+
+
+def drop_title_search_index(apps, schema_editor):
+    execute(schema_editor, DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_title_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_title_search_index, drop_title_search_index
+        ),
+    ]
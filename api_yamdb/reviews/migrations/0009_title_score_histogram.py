@@ -0,0 +1,106 @@
+# Generated by Django 3.2.25 on 2026-10-18 19:19
+
+from django.db import migrations, models
+from django.db.models import Count, F, FloatField, Q
+from django.db.models.functions import Cast
+
+# Значения на момент миграции: она не должна зависеть от того,
+# как позже изменятся константы и настройки проекта.
+SCORE_RANGE = range(1, 11)
+SCORE_COUNT_FIELDS = tuple(f'score_{score}_count' for score in SCORE_RANGE)
+RATING_PRIOR_MEAN = 5.5
+RATING_PRIOR_WEIGHT = 10
+
+
+def fill_title_score_histogram(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Review = apps.get_model('reviews', 'Review')
+    titles = []
+    for row in Review.objects.order_by().values('title_id').annotate(**{
+        field: Count('id', filter=Q(score=score))
+        for score, field in zip(SCORE_RANGE, SCORE_COUNT_FIELDS)
+    }):
+        titles.append(Title(pk=row.pop('title_id'), **row))
+    Title.objects.bulk_update(titles, SCORE_COUNT_FIELDS, batch_size=500)
+    prior = RATING_PRIOR_WEIGHT * RATING_PRIOR_MEAN
+    Title.objects.filter(review_count__gt=0).update(
+        weighted_rating=(
+            Cast('score_sum', FloatField()) + prior
+        ) / (F('review_count') + RATING_PRIOR_WEIGHT)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_title_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='score_10_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 10'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_1_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 1'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_2_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 2'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_3_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 3'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_4_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 4'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_5_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 5'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_6_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 6'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_7_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 7'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_8_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 8'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_9_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок 9'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='weighted_rating',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Взвешенный рейтинг'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['weighted_rating', 'id'], name='title_weighted_rating_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['category', 'weighted_rating', 'id'], name='title_category_weighted_idx'),
+        ),
+        migrations.RunPython(
+            fill_title_score_histogram, migrations.RunPython.noop
+        ),
+    ]
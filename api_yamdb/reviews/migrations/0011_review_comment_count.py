@@ -0,0 +1,37 @@
+# Generated by Django 3.2.25 on 2026-10-18 19:31
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_review_comment_count(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    Comment = apps.get_model('reviews', 'Comment')
+    Review.objects.bulk_update(
+        [
+            Review(pk=row['review_id'], comment_count=row['count'])
+            for row in Comment.objects.order_by().values(
+                'review_id'
+            ).annotate(count=Count('id'))
+        ],
+        ('comment_count',),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0010_feed_pub_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество комментариев'),
+        ),
+        migrations.RunPython(
+            fill_review_comment_count, migrations.RunPython.noop
+        ),
+    ]
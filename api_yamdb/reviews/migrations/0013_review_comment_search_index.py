@@ -0,0 +1,67 @@
+from django.db import migrations
+
+# SQL на момент миграции: она не должна зависеть от того, как позже
+# изменятся токенизатор, столбцы или триггеры в reviews.search.
+# Индексы отзывов и комментариев устроены одинаково, {table} —
+# таблица модели.
+CREATE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5("
+    "text, content='{table}', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT "
+    "ON {table} BEGIN "
+    "INSERT INTO {table}_fts(rowid, text) VALUES ("
+    "new.id, replace(replace(new.text, 'ё', 'е'), 'Ё', 'Е')); END",
+    "CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE "
+    "ON {table} BEGIN "
+    "INSERT INTO {table}_fts({table}_fts, rowid, text) VALUES ("
+    "'delete', old.id, replace(replace(old.text, 'ё', 'е'), 'Ё', 'Е')); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE "
+    "OF text ON {table} BEGIN "
+    "INSERT INTO {table}_fts({table}_fts, rowid, text) VALUES ("
+    "'delete', old.id, replace(replace(old.text, 'ё', 'е'), 'Ё', 'Е')); "
+    "INSERT INTO {table}_fts(rowid, text) VALUES ("
+    "new.id, replace(replace(new.text, 'ё', 'е'), 'Ё', 'Е')); END",
+    "INSERT INTO {table}_fts({table}_fts) VALUES ('delete-all')",
+    "INSERT INTO {table}_fts(rowid, text) SELECT id, "
+    "replace(replace({table}.text, 'ё', 'е'), 'Ё', 'Е') FROM {table}",
+    "INSERT INTO {table}_fts({table}_fts) VALUES ('optimize')",
+)
+DROP_SQL = (
+    'DROP TRIGGER IF EXISTS {table}_fts_ai',
+    'DROP TRIGGER IF EXISTS {table}_fts_ad',
+    'DROP TRIGGER IF EXISTS {table}_fts_au',
+    'DROP TABLE IF EXISTS {table}_fts',
+)
+TABLES = ('reviews_review', 'reviews_comment')
+
+
+def execute(schema_editor, statements):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table in TABLES:
+            for statement in statements:
+                cursor.execute(statement.format(table=table))
+
+
+def create_text_search_indexes(apps, schema_editor):
+    execute(schema_editor, CREATE_SQL)
+
+
+def drop_text_search_indexes(apps, schema_editor):
+    execute(schema_editor, DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0012_feed_author_pub_date_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_text_search_indexes, drop_text_search_indexes
+        ),
+    ]
@@ -36,6 +36,9 @@ class Category(NameSlugModel):
     class Meta(NameSlugModel.Meta):
         verbose_name = 'категория'
         verbose_name_plural = 'Категории'
+        indexes = [
+            models.Index(fields=('name',), name='category_name_idx'),
+        ]
 
 
 class Genre(NameSlugModel):
@@ -67,6 +70,79 @@ class Title(models.Model):
         verbose_name='Жанр',
     )
     description = models.TextField(verbose_name='Описание', null=True)
+    score_sum = models.PositiveIntegerField(
+        verbose_name='Сумма оценок',
+        default=0,
+        editable=False,
+    )
+    review_count = models.PositiveIntegerField(
+        verbose_name='Количество отзывов',
+        default=0,
+        editable=False,
+    )
+    rating = models.FloatField(
+        verbose_name='Рейтинг',
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    weighted_rating = models.FloatField(
+        verbose_name='Взвешенный рейтинг',
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    # Гистограмма оценок: по столбцу на каждую допустимую оценку.
+    score_1_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 1',
+        default=0,
+        editable=False,
+    )
+    score_2_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 2',
+        default=0,
+        editable=False,
+    )
+    score_3_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 3',
+        default=0,
+        editable=False,
+    )
+    score_4_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 4',
+        default=0,
+        editable=False,
+    )
+    score_5_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 5',
+        default=0,
+        editable=False,
+    )
+    score_6_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 6',
+        default=0,
+        editable=False,
+    )
+    score_7_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 7',
+        default=0,
+        editable=False,
+    )
+    score_8_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 8',
+        default=0,
+        editable=False,
+    )
+    score_9_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 9',
+        default=0,
+        editable=False,
+    )
+    score_10_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок 10',
+        default=0,
+        editable=False,
+    )
 
     class Meta:
         default_related_name = 'titles'
@@ -79,10 +155,52 @@ class Title(models.Model):
                 name='unique_name_category'
             )
         ]
+        indexes = [
+            models.Index(
+                fields=('category', 'name', 'id'),
+                name='title_category_name_id_idx'
+            ),
+            models.Index(
+                fields=('year', 'category', 'name', 'id'),
+                name='title_year_category_name_idx'
+            ),
+            models.Index(fields=('rating', 'id'), name='title_rating_id_idx'),
+            models.Index(fields=('year', 'id'), name='title_year_id_idx'),
+            models.Index(fields=('name', 'id'), name='title_name_id_idx'),
+            models.Index(
+                fields=('review_count', 'id'),
+                name='title_review_count_id_idx'
+            ),
+            models.Index(
+                fields=('category', 'rating', 'id'),
+                name='title_category_rating_idx'
+            ),
+            models.Index(
+                fields=('category', 'year', 'id'),
+                name='title_category_year_idx'
+            ),
+            models.Index(
+                fields=('category', 'review_count', 'id'),
+                name='title_category_reviews_idx'
+            ),
+            models.Index(
+                fields=('weighted_rating', 'id'),
+                name='title_weighted_rating_id_idx'
+            ),
+            models.Index(
+                fields=('category', 'weighted_rating', 'id'),
+                name='title_category_weighted_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.name[:20]
 
+    @property
+    def score_counts(self):
+        """Количество отзывов с каждой оценкой от MIN_SCORE до MAX_SCORE."""
+        return [getattr(self, field) for field in const.SCORE_COUNT_FIELDS]
+
 
 class User(AbstractUser):
     """
@@ -183,6 +301,11 @@ class Review(TextAuthorPubdateModel):
         on_delete=models.CASCADE,
         verbose_name='Произведение'
     )
+    comment_count = models.PositiveIntegerField(
+        verbose_name='Количество комментариев',
+        default=0,
+        editable=False,
+    )
 
     def __str__(self):
         return f'Отзыв на {self.title.name[:20]} от {self.author.username}'
@@ -196,6 +319,16 @@ class Review(TextAuthorPubdateModel):
                 name='unique_review_per_title_per_user'
             )
         ]
+        indexes = [
+            models.Index(
+                fields=('title', 'pub_date', 'id'),
+                name='review_title_pub_date_idx'
+            ),
+            models.Index(
+                fields=('author', 'pub_date', 'id'),
+                name='review_author_pub_date_idx'
+            ),
+        ]
 
 
 class Comment(TextAuthorPubdateModel):
@@ -218,3 +351,13 @@ class Comment(TextAuthorPubdateModel):
     class Meta(TextAuthorPubdateModel.Meta):
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = [
+            models.Index(
+                fields=('review', 'pub_date', 'id'),
+                name='comment_review_pub_date_idx'
+            ),
+            models.Index(
+                fields=('author', 'pub_date', 'id'),
+                name='comment_author_pub_date_idx'
+            ),
+        ]
@@ -0,0 +1,137 @@
+import time
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.dispatch import Signal
+
+from api_yamdb.settings import PURGE_BATCH_SIZE, PURGE_LOCK_BUDGET
+from .counters import recalculate_comment_counts
+from .models import Comment, Review, Title
+from .ratings import shift_title_ratings, title_aggregates_changed
+
+# Отправляется после удаления пачки отзывов или комментариев в обход
+# сигналов моделей: title_ids — произведения, review_ids — отзывы,
+# чьи ленты изменились.
+content_purged = Signal()
+
+
+def delete_rows(model, column, values):
+    """
+    DELETE ... WHERE column IN (values) одним запросом, без загрузки
+    объектов, каскада и сигналов post_delete для каждой строки:
+    агрегаты пересчитываются для всей пачки сразу. Запрос
+    выполняется напрямую, а не приватным QuerySet._raw_delete,
+    чтобы его поведение не зависело от версии Django.
+    """
+    values = list(values)
+    if not values:
+        return 0
+    placeholders = ', '.join(['%s'] * len(values))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)} '
+            f'WHERE {connection.ops.quote_name(column)} IN ({placeholders})',
+            values,
+        )
+        return cursor.rowcount
+
+
+def purge_comments_batch(user_id, batch_size):
+    """Удаляет пачку комментариев автора и сверяет счётчики отзывов."""
+    rows = list(Comment.objects.filter(author_id=user_id).order_by(
+        'id'
+    ).values_list('id', 'review_id', 'title_id')[:batch_size])
+    if not rows:
+        return 0
+    delete_rows(Comment, 'id', [pk for pk, _, _ in rows])
+    review_ids = {review_id for _, review_id, _ in rows}
+    recalculate_comment_counts(review_ids)
+    content_purged.send(
+        sender=Comment,
+        title_ids={title_id for _, _, title_id in rows},
+        review_ids=review_ids,
+    )
+    return len(rows)
+
+
+def purge_reviews_batch(user_id, batch_size):
+    """
+    Удаляет пачку отзывов автора вместе с комментариями к ним
+    и вычитает их оценки из агрегатов произведений: у автора
+    один отзыв на произведение, поэтому хватает одного UPDATE
+    на каждое значение оценки без чтения остальных отзывов.
+    """
+    rows = list(Review.objects.filter(author_id=user_id).order_by(
+        'id'
+    ).values_list('id', 'title_id', 'score')[:batch_size])
+    if not rows:
+        return 0
+    review_ids = {pk for pk, _, _ in rows}
+    titles_by_score = defaultdict(list)
+    for _, title_id, score in rows:
+        titles_by_score[score].append(title_id)
+    delete_rows(Comment, 'review_id', review_ids)
+    delete_rows(Review, 'id', review_ids)
+    for score, title_ids in titles_by_score.items():
+        shift_title_ratings(title_ids, removed_score=score)
+    title_ids = {title_id for _, title_id, _ in rows}
+    title_aggregates_changed.send(sender=Title, title_ids=title_ids)
+    content_purged.send(
+        sender=Review, title_ids=title_ids, review_ids=review_ids
+    )
+    return len(rows)
+
+
+# Порядок удаления: сначала комментарии автора, затем его отзывы
+# вместе с чужими комментариями к ним.
+PURGE_BATCHES = {
+    'comments': purge_comments_batch,
+    'reviews': purge_reviews_batch,
+}
+
+
+def get_next_batch_size(batch_size, elapsed, lock_budget, max_batch_size):
+    """
+    Размер следующей пачки: пропорционально меньше, если пачка
+    превысила бюджет, вдвое больше (до max_batch_size), если
+    уложилась в половину бюджета.
+    """
+    if elapsed > lock_budget:
+        return max(1, int(batch_size * lock_budget / elapsed))
+    if elapsed < lock_budget / 2:
+        return min(max_batch_size, batch_size * 2)
+    return batch_size
+
+
+def iter_purge_user_content(user_id, batch_size=PURGE_BATCH_SIZE,
+                            lock_budget=PURGE_LOCK_BUDGET):
+    """
+    Удаляет комментарии, затем отзывы пользователя пачками, каждую
+    в своей транзакции: блокировка записи SQLite освобождается между
+    пачками, агрегаты пересчитываются один раз на пачку.
+    После каждой пачки возвращает прогресс: сколько удалено
+    комментариев и отзывов, размер и длительность пачки.
+    """
+    progress = dict.fromkeys(PURGE_BATCHES, 0)
+    for kind, purge_batch in PURGE_BATCHES.items():
+        size = batch_size
+        while True:
+            started = time.monotonic()
+            with transaction.atomic():
+                deleted = purge_batch(user_id, size)
+            elapsed = time.monotonic() - started
+            if not deleted:
+                break
+            progress[kind] += deleted
+            yield dict(progress, batch_size=size, elapsed=elapsed)
+            size = get_next_batch_size(
+                size, elapsed, lock_budget, batch_size
+            )
+
+
+def count_user_content(user_id):
+    """Сколько комментариев и отзывов пользователя осталось удалить."""
+    return {
+        'comments': Comment.objects.filter(author_id=user_id).count(),
+        'reviews': Review.objects.filter(author_id=user_id).count(),
+    }
@@ -0,0 +1,179 @@
+from collections import Counter
+from math import ceil
+
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, Q, Sum, When
+from django.db.models.functions import Cast
+from django.dispatch import Signal
+
+from api_yamdb.settings import RATING_PRIOR_MEAN, RATING_PRIOR_WEIGHT
+from .constants import (
+    SCORE_COUNT_FIELD, SCORE_COUNT_FIELDS, SCORE_PERCENTILES, SCORE_RANGE
+)
+from .models import Review, Title
+
+AGGREGATE_FIELDS = (
+    'score_sum', 'review_count', 'rating', 'weighted_rating',
+    *SCORE_COUNT_FIELDS,
+)
+
+# Отправляется после массового изменения агрегатов в обход
+# сигналов моделей, аргумент title_ids — id затронутых произведений.
+title_aggregates_changed = Signal()
+
+
+def get_weighted_rating(score_sum, review_count):
+    """
+    Байесовская оценка: средняя по отзывам, сдвинутая к RATING_PRIOR_MEAN
+    тем сильнее, чем меньше отзывов. None, если отзывов нет.
+    """
+    if not review_count:
+        return None
+    return (
+        (score_sum + RATING_PRIOR_WEIGHT * RATING_PRIOR_MEAN)
+        / (review_count + RATING_PRIOR_WEIGHT)
+    )
+
+
+def get_score_histogram(score_counts):
+    """Гистограмма оценок: {оценка строкой: количество отзывов}."""
+    return {
+        str(score): count for score, count in zip(SCORE_RANGE, score_counts)
+    }
+
+
+def get_score_percentiles(score_counts):
+    """
+    Процентили оценок по гистограмме методом ближайшего ранга:
+    наименьшая оценка, которую получили не меньше p% отзывов.
+    Без отзывов возвращает None.
+    """
+    total = sum(score_counts)
+    if not total:
+        return None
+    percentiles = {}
+    for percentile in SCORE_PERCENTILES:
+        rank = ceil(percentile * total / 100)
+        cumulative = 0
+        for score, count in zip(SCORE_RANGE, score_counts):
+            cumulative += count
+            if cumulative >= rank:
+                percentiles[str(percentile)] = score
+                break
+    return percentiles
+
+
+def shift_title_rating(title_id, added_score=None, removed_score=None):
+    """
+    Атомарно учитывает в агрегатах произведения добавленную
+    и/или убранную оценку и пересчитывает рейтинги одним UPDATE
+    без чтения отзывов. Изменение оценки отзыва — это добавление
+    новой оценки и удаление прежней.
+    """
+    shift_title_ratings([title_id], added_score, removed_score)
+
+
+def shift_title_ratings(title_ids, added_score=None, removed_score=None):
+    """
+    То же для нескольких произведений, у каждого из которых
+    добавилась и/или убралась одна и та же оценка.
+    """
+    score_deltas = Counter()
+    if added_score is not None:
+        score_deltas[added_score] += 1
+    if removed_score is not None:
+        score_deltas[removed_score] -= 1
+    shift_title_scores(title_ids, score_deltas)
+
+
+def shift_title_scores(title_ids, score_deltas):
+    """
+    Прибавляет к гистограмме оценок произведений score_deltas
+    ({оценка: изменение количества отзывов}) и пересчитывает
+    рейтинги одним UPDATE с F(), без чтения отзывов: конкурентные
+    изменения тех же произведений не теряются.
+    """
+    score_delta = count_delta = 0
+    updates = {}
+    for score, delta in score_deltas.items():
+        if not delta:
+            continue
+        field = SCORE_COUNT_FIELD.format(score=score)
+        updates[field] = F(field) + delta
+        score_delta += score * delta
+        count_delta += delta
+    score_sum = F('score_sum') + score_delta
+    review_count = F('review_count') + count_delta
+    has_reviews = Q(review_count__gt=-count_delta)
+    Title.objects.filter(pk__in=title_ids).update(
+        score_sum=score_sum,
+        review_count=review_count,
+        rating=Case(
+            When(has_reviews, then=Cast(score_sum, FloatField())
+                 / review_count),
+            default=None,
+            output_field=FloatField(),
+        ),
+        weighted_rating=Case(
+            When(has_reviews, then=(
+                Cast(score_sum, FloatField())
+                + RATING_PRIOR_WEIGHT * RATING_PRIOR_MEAN
+            ) / (review_count + RATING_PRIOR_WEIGHT)),
+            default=None,
+            output_field=FloatField(),
+        ),
+        **updates,
+    )
+
+
+def recalculate_title_ratings(title_ids=None):
+    """
+    Пересчитывает агрегаты и гистограммы оценок по таблице отзывов
+    одним сгруппированным запросом.
+    Без title_ids пересчитываются все произведения.
+    Возвращает количество обновлённых произведений.
+    """
+    titles = Title.objects.all()
+    reviews = Review.objects.all()
+    if title_ids is not None:
+        titles = titles.filter(pk__in=title_ids)
+        reviews = reviews.filter(title_id__in=title_ids)
+    aggregates = {
+        row.pop('title_id'): row
+        for row in reviews.order_by().values('title_id').annotate(
+            score_sum=Sum('score'),
+            review_count=Count('id'),
+            **{
+                field: Count('id', filter=Q(score=score))
+                for score, field in zip(SCORE_RANGE, SCORE_COUNT_FIELDS)
+            },
+        )
+    }
+    changed = []
+    for title in titles.only('id', *AGGREGATE_FIELDS).iterator(
+        chunk_size=2000
+    ):
+        values = aggregates.get(title.pk) or dict.fromkeys(
+            ('score_sum', 'review_count', *SCORE_COUNT_FIELDS), 0
+        )
+        review_count = values['review_count']
+        values['rating'] = (
+            values['score_sum'] / review_count if review_count else None
+        )
+        values['weighted_rating'] = get_weighted_rating(
+            values['score_sum'], review_count
+        )
+        if any(
+            getattr(title, field) != values[field]
+            for field in AGGREGATE_FIELDS
+        ):
+            for field in AGGREGATE_FIELDS:
+                setattr(title, field, values[field])
+            changed.append(title)
+    with transaction.atomic():
+        Title.objects.bulk_update(changed, AGGREGATE_FIELDS, batch_size=500)
+    if changed:
+        title_aggregates_changed.send(
+            sender=Title, title_ids=[title.pk for title in changed]
+        )
+    return len(changed)
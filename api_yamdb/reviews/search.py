@@ -0,0 +1,169 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_TOKEN_REGEX = re.compile(r'\w+')
+FTS_TOKENIZER = 'unicode61 remove_diacritics 2'
+
+
+def fold_text(text):
+    """Приводит «ё» к «е»: unicode61 не считает их одной буквой."""
+    return text.replace('ё', 'е').replace('Ё', 'Е')
+
+
+def fold_sql(column):
+    return f"replace(replace({column}, 'ё', 'е'), 'Ё', 'Е')"
+
+
+def build_match_query(text):
+    """
+    Превращает пользовательский ввод в запрос FTS5: каждое слово
+    берётся в кавычки и ищется по префиксу, слова объединяются по И.
+    Пустая строка означает, что искать нечего.
+    """
+    return ' '.join(
+        f'"{token}"*'
+        for token in SEARCH_TOKEN_REGEX.findall(fold_text(text))
+    )
+
+
+class FullTextIndex:
+    """
+    Полнотекстовый индекс FTS5 над таблицей модели (external content).
+    Текст индексируется с заменой «ё» на «е», синхронизация
+    с таблицей модели выполняется триггерами.
+    """
+
+    def __init__(self, model_table, columns, weights):
+        self.model_table = model_table
+        self.table = f'{model_table}_fts'
+        self.columns = columns
+        self.weights = weights
+
+    def get_values_sql(self, prefix):
+        return ', '.join(
+            fold_sql(f'{prefix}.{column}') for column in self.columns
+        )
+
+    def get_create_sql(self):
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+            f"{', '.join(self.columns)}, content='{self.model_table}', "
+            f"content_rowid='id', tokenize='{FTS_TOKENIZER}')",
+            *self.get_triggers_sql(),
+        ]
+
+    def get_triggers_sql(self):
+        columns = ', '.join(self.columns)
+        insert = (
+            f'INSERT INTO {self.table}(rowid, {columns}) '
+            f"VALUES (new.id, {self.get_values_sql('new')});"
+        )
+        delete = (
+            f'INSERT INTO {self.table}({self.table}, rowid, {columns}) '
+            f"VALUES ('delete', old.id, {self.get_values_sql('old')});"
+        )
+        return [
+            f'CREATE TRIGGER IF NOT EXISTS {self.table}_ai AFTER INSERT '
+            f'ON {self.model_table} BEGIN {insert} END',
+            f'CREATE TRIGGER IF NOT EXISTS {self.table}_ad AFTER DELETE '
+            f'ON {self.model_table} BEGIN {delete} END',
+            f'CREATE TRIGGER IF NOT EXISTS {self.table}_au AFTER UPDATE '
+            f'OF {columns} ON {self.model_table} BEGIN {delete} {insert} END',
+        ]
+
+    def get_drop_sql(self):
+        return [
+            *(
+                f'DROP TRIGGER IF EXISTS {self.table}_{suffix}'
+                for suffix in ('ai', 'ad', 'au')
+            ),
+            f'DROP TABLE IF EXISTS {self.table}',
+        ]
+
+    def get_rebuild_sql(self):
+        return [
+            f"INSERT INTO {self.table}({self.table}) VALUES ('delete-all')",
+            f"INSERT INTO {self.table}(rowid, {', '.join(self.columns)}) "
+            f"SELECT id, {self.get_values_sql(self.model_table)} "
+            f'FROM {self.model_table}',
+            f"INSERT INTO {self.table}({self.table}) VALUES ('optimize')",
+        ]
+
+    def execute(self, statements, using=connection):
+        with using.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    def filter(self, queryset, text, fallback_fields):
+        """
+        Оставляет в queryset записи, совпадающие с text, без
+        ранжирования. Условие — подзапрос по индексу без ссылок
+        на таблицу модели, поэтому выборку можно встраивать
+        в другие запросы (фасеты). На СУБД без FTS5 — поиск
+        по вхождению подстроки в fallback_fields.
+        """
+        if connection.vendor != 'sqlite':
+            condition = Q()
+            for field in fallback_fields:
+                condition |= Q(**{f'{field}__icontains': text})
+            return queryset.filter(condition)
+        match_query = build_match_query(text)
+        if not match_query:
+            return queryset.none()
+        return queryset.filter(pk__in=RawSQL(
+            f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s',
+            (match_query,),
+        ))
+
+    def search(self, queryset, text, fallback_fields):
+        """
+        Фильтрует queryset по совпадению с text и сортирует
+        по релевантности (bm25, столбец search_rank: чем меньше,
+        тем релевантнее). Индекс присоединяется к таблице модели
+        по rowid, поэтому MATCH и bm25 вычисляются одним проходом
+        по индексу, а не отдельным подзапросом на каждое совпадение.
+        На СУБД без FTS5 — filter() без ранжирования.
+        """
+        if connection.vendor != 'sqlite':
+            return self.filter(queryset, text, fallback_fields).extra(
+                select={'search_rank': '0'}
+            )
+        match_query = build_match_query(text)
+        if not match_query:
+            return queryset.extra(select={'search_rank': '0'}).none()
+        weights = ', '.join(str(weight) for weight in self.weights)
+        return queryset.extra(
+            select={'search_rank': f'bm25({self.table}, {weights})'},
+            tables=[self.table],
+            where=[
+                f'{self.table}.rowid = {self.model_table}.id',
+                f'{self.table} MATCH %s',
+            ],
+            params=[match_query],
+        ).order_by('search_rank', 'id')
+
+
+TITLE_SEARCH_INDEX = FullTextIndex(
+    'reviews_title', ('name', 'description'), (10.0, 1.0)
+)
+REVIEW_SEARCH_INDEX = FullTextIndex('reviews_review', ('text',), (1.0,))
+COMMENT_SEARCH_INDEX = FullTextIndex('reviews_comment', ('text',), (1.0,))
+SEARCH_INDEXES = (
+    TITLE_SEARCH_INDEX, REVIEW_SEARCH_INDEX, COMMENT_SEARCH_INDEX
+)
+
+
+def install_search_triggers(using=connection):
+    """
+    Пересоздаёт недостающие триггеры: SQLite удаляет их вместе
+    с таблицей, когда миграция перестраивает таблицу модели.
+    """
+    if using.vendor != 'sqlite':
+        return
+    tables = set(using.introspection.table_names())
+    for index in SEARCH_INDEXES:
+        if index.table in tables:
+            index.execute(index.get_triggers_sql(), using)
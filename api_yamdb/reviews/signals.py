@@ -0,0 +1,68 @@
+from django.db import connections
+from django.db.models.signals import (
+    post_delete, post_migrate, post_save, pre_save
+)
+from django.dispatch import receiver
+
+from .counters import shift_comment_count
+from .models import Comment, Review
+from .ratings import shift_title_rating
+from .search import install_search_triggers
+
+
+@receiver(pre_save, sender=Review)
+def remember_review_score(sender, instance, raw, **kwargs):
+    """Запоминает прежние произведение и оценку изменяемого отзыва."""
+    instance._previous_rating_state = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_rating_state = Review.objects.filter(
+        pk=instance.pk
+    ).values_list('title_id', 'score').first()
+
+
+@receiver(post_save, sender=Review)
+def update_rating_on_review_save(sender, instance, created, raw, **kwargs):
+    """Учитывает новый или изменённый отзыв в рейтинге произведения."""
+    if raw:
+        return
+    previous = getattr(instance, '_previous_rating_state', None)
+    if created or previous is None:
+        shift_title_rating(instance.title_id, added_score=instance.score)
+        return
+    previous_title_id, previous_score = previous
+    if previous_title_id != instance.title_id:
+        shift_title_rating(previous_title_id, removed_score=previous_score)
+        shift_title_rating(instance.title_id, added_score=instance.score)
+    elif previous_score != instance.score:
+        shift_title_rating(
+            instance.title_id,
+            added_score=instance.score,
+            removed_score=previous_score,
+        )
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_on_review_delete(sender, instance, **kwargs):
+    """Исключает удалённый отзыв из рейтинга произведения."""
+    shift_title_rating(instance.title_id, removed_score=instance.score)
+
+
+@receiver(post_save, sender=Comment)
+def update_comment_count_on_save(sender, instance, created, raw, **kwargs):
+    """Учитывает новый комментарий в счётчике отзыва."""
+    if created and not raw:
+        shift_comment_count(instance.review_id, 1)
+
+
+@receiver(post_delete, sender=Comment)
+def update_comment_count_on_delete(sender, instance, **kwargs):
+    """Исключает удалённый комментарий из счётчика отзыва."""
+    shift_comment_count(instance.review_id, -1)
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using, **kwargs):
+    """Возвращает триггеры полнотекстового поиска после миграций."""
+    if sender.name == 'reviews':
+        install_search_triggers(connections[using])
@@ -0,0 +1,165 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from reviews.ratings import get_weighted_rating
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_title(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json()
+
+    def test_01_rating_follows_review_changes(self, client, admin_client,
+                                              user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(admin_client, title_id, 'Хорошо', 9)
+        review = create_single_review(
+            user_client, title_id, 'Плохо', 2
+        ).json()
+        assert self.get_title(client, title_id)['rating'] == 5, (
+            'Проверьте, что рейтинг произведения пересчитывается '
+            'при создании отзыва.'
+        )
+
+        response = user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            ),
+            data={'score': 7}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.get_title(client, title_id)['rating'] == 8, (
+            'Проверьте, что рейтинг произведения пересчитывается '
+            'при изменении оценки в отзыве.'
+        )
+
+        response = user_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            )
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_title(client, title_id)['rating'] == 9, (
+            'Проверьте, что рейтинг произведения пересчитывается '
+            'при удалении отзыва.'
+        )
+        assert self.get_title(client, titles[1]['id'])['rating'] is None
+
+    def test_02_rating_after_author_deleted(self, client, admin_client,
+                                            user, user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(admin_client, title_id, 'Хорошо', 10)
+        create_single_review(user_client, title_id, 'Плохо', 1)
+        user.delete()
+        assert self.get_title(client, title_id)['rating'] == 10, (
+            'Проверьте, что каскадное удаление отзывов '
+            'учитывается в рейтинге произведения.'
+        )
+
+    def test_03_recalculate_ratings_command(self, admin_client):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(admin_client, title_id, 'Хорошо', 6)
+        Title.objects.update(score_sum=0, review_count=0, rating=None)
+        call_command('recalculate_ratings')
+        title = Title.objects.get(pk=title_id)
+        assert (title.score_sum, title.review_count, title.rating) == (
+            6, 1, 6.0
+        ), (
+            'Проверьте, что команда `recalculate_ratings` '
+            'восстанавливает агрегаты оценок произведений.'
+        )
+
+    def test_04_histogram_follows_review_changes(self, client, admin_client,
+                                                 moderator_client,
+                                                 user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(admin_client, title_id, 'Отлично', 10)
+        create_single_review(moderator_client, title_id, 'Хорошо', 8)
+        review = create_single_review(
+            user_client, title_id, 'Плохо', 2
+        ).json()
+        user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            ),
+            data={'score': 3}
+        )
+        title = self.get_title(client, title_id)
+        expected = dict.fromkeys(map(str, range(1, 11)), 0)
+        expected.update({'3': 1, '8': 1, '10': 1})
+        assert title['score_histogram'] == expected, (
+            'Проверьте, что гистограмма оценок произведения обновляется '
+            'при создании и изменении отзыва.'
+        )
+        assert title['score_percentiles'] == {
+            '25': 3, '50': 8, '75': 10, '90': 10
+        }
+        assert title['weighted_rating'] == pytest.approx(
+            get_weighted_rating(21, 3)
+        ), (
+            'Проверьте, что взвешенный рейтинг сдвигает среднюю оценку '
+            'к априорной тем сильнее, чем меньше отзывов.'
+        )
+
+        user_client.delete(self.REVIEW_DETAIL_URL_TEMPLATE.format(
+            title_id=title_id, review_id=review['id']
+        ))
+        title = self.get_title(client, title_id)
+        assert title['score_histogram']['3'] == 0
+        empty_title = self.get_title(client, titles[1]['id'])
+        assert empty_title['weighted_rating'] is None
+        assert empty_title['score_percentiles'] is None
+
+    def test_05_weighted_rating_ordering(self, client, admin_client,
+                                         user_client):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        single_ten, many_nines = titles[0]['id'], titles[1]['id']
+        create_single_review(admin_client, single_ten, 'Шедевр', 10)
+        Title.objects.filter(pk=many_nines).update(
+            score_sum=9 * 5000, review_count=5000, score_9_count=5000,
+            rating=9.0, weighted_rating=get_weighted_rating(9 * 5000, 5000),
+        )
+        response = client.get(
+            '/api/v1/titles/', {'ordering': '-weighted_rating'}
+        )
+        ids = [title['id'] for title in response.json()['results']]
+        assert ids[:2] == [many_nines, single_ten], (
+            'Проверьте, что по взвешенному рейтингу произведение '
+            'с множеством высоких оценок выше произведения с одной оценкой.'
+        )
+
+    def test_06_recalculate_restores_histogram(self, admin_client):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(admin_client, title_id, 'Хорошо', 7)
+        Title.objects.update(score_7_count=0, weighted_rating=None)
+        call_command('recalculate_ratings')
+        title = Title.objects.get(pk=title_id)
+        assert title.score_7_count == 1
+        assert title.weighted_rating == pytest.approx(
+            get_weighted_rating(7, 1)
+        )
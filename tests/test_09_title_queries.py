@@ -0,0 +1,53 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework.pagination import PageNumberPagination
+
+from reviews.models import Title
+from tests.utils import create_catalog
+
+LIST_QUERIES = 3  # COUNT, произведения с категориями, жанры
+DETAIL_QUERIES = 2  # произведение с категорией, жанры
+
+
+@pytest.mark.django_db
+class Test09TitleQueries:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    @pytest.mark.parametrize('page_size', (10, 100, 1000))
+    def test_01_list_queries(self, client, monkeypatch,
+                             django_assert_num_queries, page_size):
+        create_catalog(page_size)
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        with django_assert_num_queries(LIST_QUERIES):
+            response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()['results']
+        assert len(results) == page_size
+        assert all(len(title['genre']) == 2 for title in results), (
+            'Проверьте, что жанры произведений загружаются '
+            f'для всех элементов страницы `{self.TITLES_URL}`.'
+        )
+
+    @pytest.mark.parametrize('catalog_size', (10, 100, 1000))
+    def test_02_detail_queries(self, client, django_assert_num_queries,
+                               catalog_size):
+        create_catalog(catalog_size)
+        title = Title.objects.last()
+        with django_assert_num_queries(DETAIL_QUERIES):
+            response = client.get(
+                self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=title.id)
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['category']['slug'] == title.category.slug
+
+    def test_03_filter_plans_use_indexes(self):
+        call_command('explain_title_filters', titles=2000, stdout=StringIO())
+        assert not Title.objects.exists(), (
+            'Проверьте, что команда `explain_title_filters` откатывает '
+            'созданные для проверки данные.'
+        )
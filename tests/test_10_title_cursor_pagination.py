@@ -0,0 +1,77 @@
+from http import HTTPStatus
+
+import pytest
+
+from api.constants import TITLE_ORDERING
+from reviews.models import Category, Title
+from tests.utils import create_catalog
+
+
+@pytest.mark.django_db
+class Test10TitleCursorPagination:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_cursor_walks_whole_catalog(self, client,
+                                           django_assert_num_queries):
+        create_catalog(35)
+        expected_ids = list(
+            Title.objects.order_by('category_id', 'name', 'id')
+            .values_list('id', flat=True)
+        )
+        url = f'{self.TITLES_URL}?cursor='
+        received_ids = []
+        while url:
+            with django_assert_num_queries(2):
+                response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            assert 'count' not in data, (
+                'Проверьте, что в режиме курсора не выполняется подсчёт '
+                'общего количества произведений.'
+            )
+            received_ids.extend(title['id'] for title in data['results'])
+            url = data['next']
+        assert received_ids == expected_ids, (
+            'Проверьте, что курсорная пагинация `/api/v1/titles/` '
+            'возвращает все произведения ровно один раз и по порядку.'
+        )
+
+    def test_02_page_number_mode_kept(self, client):
+        create_catalog(15)
+        response = client.get(self.TITLES_URL, {'page': 2})
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data['count'] == 15
+        assert len(data['results']) == 5
+
+    def test_03_invalid_cursor(self, client):
+        create_catalog(1)
+        for cursor in ('not-a-cursor', 'WyJhIiwiYiIsImMiXQ=='):
+            response = client.get(self.TITLES_URL, {'cursor': cursor})
+            assert response.status_code == HTTPStatus.NOT_FOUND, (
+                'Проверьте, что некорректный курсор приводит к ответу '
+                'со статусом 404.'
+            )
+
+    def test_04_default_order(self, client):
+        create_catalog(9)
+        Category.objects.filter(slug='category-0').update(name='Яблоко')
+        results = client.get(self.TITLES_URL).json()['results']
+        assert [title['id'] for title in results] == list(
+            Title.objects.order_by('category__name', 'name')
+            .values_list('id', flat=True)
+        ), (
+            'Проверьте, что список `/api/v1/titles/` по умолчанию '
+            'упорядочен по названию категории и названию произведения.'
+        )
+        results = client.get(
+            self.TITLES_URL, {'cursor': ''}
+        ).json()['results']
+        assert [title['id'] for title in results] == list(
+            Title.objects.order_by(*TITLE_ORDERING)
+            .values_list('id', flat=True)
+        ), (
+            'Проверьте, что курсорный режим упорядочен '
+            'по id категории, названию и id.'
+        )
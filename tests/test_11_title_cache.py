@@ -0,0 +1,88 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11TitleCache:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    GENRE_DETAIL_URL_TEMPLATE = '/api/v1/genres/{slug}/'
+    CACHE_STATS_URL = '/api/v1/titles/cache-stats/'
+
+    def test_01_repeated_list_is_served_from_cache(
+            self, client, admin_client, django_assert_num_queries):
+        create_titles(admin_client)
+        response = client.get(self.TITLES_URL, {'year': 1984})
+        assert response['X-Cache'] == 'MISS'
+        with django_assert_num_queries(0):
+            cached = client.get(self.TITLES_URL, {'year': 1984})
+        assert cached['X-Cache'] == 'HIT', (
+            f'Проверьте, что повторный GET-запрос к `{self.TITLES_URL}` '
+            'обслуживается из кэша.'
+        )
+        assert cached.json() == response.json()
+        response = admin_client.get(self.CACHE_STATS_URL)
+        assert response.json() == {'hits': 1, 'misses': 1}, (
+            f'Проверьте, что `{self.CACHE_STATS_URL}` возвращает счётчики '
+            'попаданий и промахов кэша.'
+        )
+        assert client.get(self.CACHE_STATS_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+
+    def test_02_params_are_normalized(self, client, admin_client):
+        create_titles(admin_client)
+        client.get(f'{self.TITLES_URL}?year=1984&category=films')
+        response = client.get(f'{self.TITLES_URL}?category=films&year=1984')
+        assert response['X-Cache'] == 'HIT', (
+            'Проверьте, что порядок параметров фильтрации не влияет '
+            'на ключ кэша.'
+        )
+        response = client.get(self.TITLES_URL, {'year': 1988})
+        assert response['X-Cache'] == 'MISS'
+
+    def test_03_review_invalidates_title(self, client, admin_client,
+                                         user_client):
+        titles, _, _ = create_titles(admin_client)
+        detail_url = self.TITLES_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id']
+        )
+        client.get(self.TITLES_URL)
+        client.get(detail_url)
+        create_single_review(admin_client, titles[0]['id'], 'Отлично', 8)
+        response = client.get(detail_url)
+        assert response['X-Cache'] == 'MISS'
+        assert response.json()['rating'] == 8, (
+            'Проверьте, что новый отзыв сбрасывает кэш произведения.'
+        )
+        results = client.get(self.TITLES_URL).json()['results']
+        assert {title['rating'] for title in results} == {8, None}
+
+        other_url = self.TITLES_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[1]['id']
+        )
+        client.get(other_url)
+        create_single_review(user_client, titles[0]['id'], 'Плохо', 8)
+        assert client.get(other_url)['X-Cache'] == 'HIT', (
+            'Проверьте, что отзыв сбрасывает кэш только своего произведения.'
+        )
+
+    def test_04_genre_change_invalidates_titles(self, client, admin_client):
+        titles, _, genres = create_titles(admin_client)
+        detail_url = self.TITLES_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id']
+        )
+        client.get(detail_url)
+        response = admin_client.delete(
+            self.GENRE_DETAIL_URL_TEMPLATE.format(slug=genres[0]['slug'])
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        response = client.get(detail_url)
+        assert response['X-Cache'] == 'MISS'
+        assert genres[0] not in response.json()['genre'], (
+            'Проверьте, что удаление жанра сбрасывает кэш произведений.'
+        )
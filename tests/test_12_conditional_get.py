@@ -0,0 +1,116 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.checks import run_checks
+from django.test import override_settings
+
+from tests.utils import create_comments, create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ConditionalGet:
+
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def check_not_modified(self, client, url, django_assert_num_queries):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.has_header('ETag') and response.has_header(
+            'Last-Modified'
+        ), (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            'заголовки `ETag` и `Last-Modified`.'
+        )
+        with django_assert_num_queries(0):
+            cached = client.get(
+                url, HTTP_IF_NONE_MATCH=response['ETag']
+            )
+        assert cached.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным '
+            '`If-None-Match` возвращает ответ со статусом 304.'
+        )
+        assert cached['ETag'] == response['ETag']
+        cached = client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+        )
+        assert cached.status_code == HTTPStatus.NOT_MODIFIED
+        return response['ETag']
+
+    def test_01_not_modified(self, client, admin_client, admin, user,
+                             user_client, moderator, moderator_client,
+                             django_assert_num_queries):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        title_id = titles[0]['id']
+        urls = (
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=title_id),
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title_id),
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            ),
+        )
+        for url in urls:
+            self.check_not_modified(client, url, django_assert_num_queries)
+
+    def test_02_etag_changes_with_data(self, client, admin_client, admin,
+                                       user, user_client, moderator_client,
+                                       django_assert_num_queries):
+        author_map = {admin: admin_client, user: user_client}
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        title_id = titles[0]['id']
+        reviews_url = self.REVIEWS_URL_TEMPLATE.format(title_id=title_id)
+        comments_url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=title_id, review_id=reviews[0]['id']
+        )
+        reviews_etag = self.check_not_modified(
+            client, reviews_url, django_assert_num_queries
+        )
+        comments_etag = self.check_not_modified(
+            client, comments_url, django_assert_num_queries
+        )
+
+        create_single_review(moderator_client, title_id, 'Новый отзыв', 3)
+        response = client.get(reviews_url, HTTP_IF_NONE_MATCH=reviews_etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что новый отзыв меняет `ETag` списка отзывов.'
+        )
+        response = client.get(comments_url, HTTP_IF_NONE_MATCH=comments_etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        response = user_client.patch(
+            '/api/v1/users/me/', data={'username': 'RenamedUser'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = client.get(comments_url, HTTP_IF_NONE_MATCH=comments_etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что смена имени автора меняет `ETag` '
+            'списка комментариев.'
+        )
+        assert 'RenamedUser' in {
+            comment['author'] for comment in response.json()['results']
+        }
+
+    def test_03_per_process_stamps(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        with override_settings(VERSION_STAMP_CACHE='default'):
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            assert not response.has_header('ETag'), (
+                'Проверьте, что при штампах версий в памяти процесса '
+                'условные запросы отключены.'
+            )
+            assert not response.has_header('X-Cache'), (
+                'Проверьте, что при штампах версий в памяти процесса '
+                'кэширование ответов отключено.'
+            )
+            assert 'api.W001' in {message.id for message in run_checks()}
+        assert 'api.W001' not in {message.id for message in run_checks()}
@@ -0,0 +1,82 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13TitleSearch:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def search(self, client, text, **params):
+        response = client.get(self.TITLES_URL, {'search': text, **params})
+        assert response.status_code == HTTPStatus.OK
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_search_by_name_and_description(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        assert self.search(client, 'терминат') == ['Терминатор'], (
+            'Проверьте, что параметр `search` ищет произведения '
+            'по началу слова в названии без учёта регистра.'
+        )
+        assert self.search(client, 'yippie') == ['Крепкий орешек'], (
+            'Проверьте, что параметр `search` ищет произведения '
+            'по описанию.'
+        )
+        assert self.search(client, 'орешек yippie') == ['Крепкий орешек']
+        assert self.search(client, 'орешек терминатор') == []
+        assert self.search(client, '"*') == []
+        assert self.search(client, 'орешек', year=1984) == []
+
+    def test_02_search_is_ranked(self, client, admin_client):
+        create_titles(admin_client)
+        admin_client.post(self.TITLES_URL, data={
+            'name': 'Ёлка',
+            'year': 2010,
+            'genre': ['comedy'],
+            'category': 'films',
+            'description': 'Совсем не терминатор.',
+        })
+        assert self.search(client, 'терминатор') == ['Терминатор', 'Ёлка'], (
+            'Проверьте, что совпадение в названии ранжируется выше '
+            'совпадения в описании.'
+        )
+        assert self.search(client, 'елка') == ['Ёлка'], (
+            'Проверьте, что поиск не различает буквы «е» и «ё».'
+        )
+
+    def test_03_index_follows_changes(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        detail_url = self.TITLES_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id']
+        )
+        admin_client.patch(detail_url, data={'name': 'Робокоп'})
+        assert self.search(client, 'терминатор') == []
+        assert self.search(client, 'робокоп') == ['Робокоп'], (
+            'Проверьте, что поисковый индекс обновляется при изменении '
+            'произведения.'
+        )
+        admin_client.delete(detail_url)
+        assert self.search(client, 'робокоп') == []
+        call_command('rebuild_search_index', stdout=StringIO())
+        assert self.search(client, 'орешек') == ['Крепкий орешек']
+
+    def test_04_single_match_per_query(self, client, admin_client):
+        create_titles(admin_client)
+        with CaptureQueriesContext(connection) as queries:
+            self.search(client, 'терминатор')
+        assert all(
+            query['sql'].count('MATCH') <= 1
+            for query in queries.captured_queries
+        ), (
+            'Проверьте, что релевантность произведений вычисляется '
+            'в соединении с индексом, без повторного MATCH '
+            'для каждого совпадения.'
+        )
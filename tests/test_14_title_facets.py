@@ -0,0 +1,76 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14TitleFacets:
+
+    FACETS_URL = '/api/v1/titles/facets/'
+
+    def test_01_facet_counts(self, client, admin_client,
+                             django_assert_num_queries):
+        create_titles(admin_client)
+        with django_assert_num_queries(3):
+            response = client.get(self.FACETS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.FACETS_URL}` '
+            'возвращает ответ со статусом 200.'
+        )
+        assert response.json() == {
+            'genre': [
+                {'slug': 'drama', 'name': 'Драма', 'count': 1},
+                {'slug': 'comedy', 'name': 'Комедия', 'count': 1},
+                {'slug': 'horror', 'name': 'Ужасы', 'count': 1},
+            ],
+            'category': [
+                {'slug': 'books', 'name': 'Книги', 'count': 1},
+                {'slug': 'films', 'name': 'Фильм', 'count': 1},
+            ],
+            'year': [
+                {'year': 1984, 'count': 1},
+                {'year': 1988, 'count': 1},
+            ],
+        }
+
+    def test_02_facets_follow_filters(self, client, admin_client,
+                                      django_assert_num_queries):
+        create_titles(admin_client)
+        params = {'genre': 'comedy', 'facets': 'category,year'}
+        with django_assert_num_queries(2):
+            response = client.get(self.FACETS_URL, params)
+        assert response.json() == {
+            'category': [{'slug': 'films', 'name': 'Фильм', 'count': 1}],
+            'year': [{'year': 1984, 'count': 1}],
+        }, (
+            'Проверьте, что счётчики фасетов учитывают фильтры '
+            'и параметр `facets`.'
+        )
+        with django_assert_num_queries(0):
+            response = client.get(self.FACETS_URL, params)
+        assert response['X-Cache'] == 'HIT'
+
+    def test_03_unknown_facet(self, client, admin_client):
+        create_titles(admin_client)
+        response = client.get(self.FACETS_URL, {'facets': 'genre,author'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_04_facets_with_search(self, client, admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        response = client.get(self.FACETS_URL, {'search': 'терминатор'})
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что фасеты можно считать вместе '
+            'с полнотекстовым поиском `search`.'
+        )
+        data = response.json()
+        assert sorted(genre['slug'] for genre in data['genre']) == sorted(
+            titles[0]['genre']
+        )
+        assert data['category'] == [{
+            'slug': categories[0]['slug'],
+            'name': categories[0]['name'],
+            'count': 1,
+        }]
+        assert data['year'] == [{'year': 1984, 'count': 1}]
@@ -0,0 +1,96 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.values_serializers import ValuesSerializer
+from tests.utils import create_catalog
+
+
+@pytest.mark.django_db
+class Test15TitleFields:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def test_01_narrow_list(self, client):
+        create_catalog(15)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(
+                self.TITLES_URL, {'fields': 'id,name,rating'}
+            )
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()['results']
+        assert all(
+            set(title) == {'id', 'name', 'rating'} for title in results
+        ), (
+            f'Проверьте, что параметр `fields` эндпоинта `{self.TITLES_URL}` '
+            'оставляет в ответе только запрошенные поля.'
+        )
+        assert len(queries) == 2, (
+            'Проверьте, что без поля `genre` жанры не загружаются.'
+        )
+        columns = queries[-1]['sql'].split(' FROM ')[0]
+        assert 'description' not in columns and (
+            'reviews_category' not in columns
+        ), (
+            'Проверьте, что незапрошенные поля не загружаются из базы.'
+        )
+
+    def test_02_nested_fields(self, client, django_assert_num_queries):
+        create_catalog(15)
+        with django_assert_num_queries(3):
+            response = client.get(
+                self.TITLES_URL, {'fields': 'name,genre,category'}
+            )
+        title = response.json()['results'][0]
+        assert set(title) == {'name', 'genre', 'category'}
+        assert len(title['genre']) == 2
+        assert set(title['category']) == {'name', 'slug'}
+
+        response = client.get(
+            self.TITLES_URL, {'fields': 'name', 'cursor': ''}
+        )
+        assert len(response.json()['results']) == 10
+        response = client.get(response.json()['next'])
+        assert len(response.json()['results']) == 5, (
+            'Проверьте, что параметр `fields` совместим с курсорной '
+            'пагинацией.'
+        )
+
+    def test_03_detail_and_errors(self, client):
+        create_catalog(1)
+        title_id = client.get(self.TITLES_URL).json()['results'][0]['id']
+        response = client.get(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=title_id),
+            {'fields': 'year'}
+        )
+        assert response.json() == {'year': 2000}
+        response = client.get(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=title_id),
+            {'fields': 'score_percentiles,score_histogram'}
+        )
+        assert response.json()['score_percentiles'] is None
+        assert sum(response.json()['score_histogram'].values()) == 0, (
+            'Проверьте, что поля гистограммы оценок можно запросить '
+            'параметром `fields`.'
+        )
+        response = client.get(self.TITLES_URL, {'fields': 'name,secret'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_04_fields_cache_key(self, client):
+        create_catalog(3)
+        ValuesSerializer.for_serializer.cache_clear()
+        responses = [
+            client.get(self.TITLES_URL, {'fields': fields}).json()
+            for fields in ('id,name', 'name,id', 'name,id,name,,id')
+        ]
+        assert responses[0] == responses[1] == responses[2]
+        assert ValuesSerializer.for_serializer.cache_info().currsize == 1, (
+            'Проверьте, что перестановки и повторы в параметре `fields` '
+            'используют один закэшированный сериализатор.'
+        )
+        assert ValuesSerializer.for_serializer.cache_info().maxsize, (
+            'Проверьте, что размер кэша сериализаторов ограничен.'
+        )
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from api.serializers import (
+    CategorySerializer, CommentSerializer, GenreSerializer, ReviewSerializer,
+    TitleReadSerializer
+)
+from api.values_serializers import ValuesSerializer
+from reviews.models import Category, Comment, Genre, Review, Title
+from tests.utils import create_catalog
+
+
+def render_both(serializer_class, queryset, fields=None):
+    kwargs = {} if fields is None else {'fields': fields}
+    values_serializer = ValuesSerializer.for_serializer(
+        serializer_class, fields
+    )
+    renderer = JSONRenderer()
+    return (
+        renderer.render(serializer_class(queryset, many=True, **kwargs).data),
+        renderer.render(values_serializer.serialize(
+            values_serializer.get_queryset(queryset)
+        )),
+    )
+
+
+@pytest.mark.django_db
+class Test16ValuesSerializers:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def create_discussion(self, client, user_client):
+        title = Title.objects.first()
+        for author_client, score in ((client, 7), (user_client, 4)):
+            response = author_client.post(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk),
+                {'text': 'Отзыв «ёлка»', 'score': score},
+            )
+            review_id = response.json()['id']
+            author_client.post(
+                f'{self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk)}'
+                f'{review_id}/comments/',
+                {'text': 'Комментарий'},
+            )
+
+    @pytest.mark.parametrize('serializer_class, model', (
+        (TitleReadSerializer, Title),
+        (GenreSerializer, Genre),
+        (CategorySerializer, Category),
+        (ReviewSerializer, Review),
+        (CommentSerializer, Comment),
+    ))
+    def test_01_identical_json(
+        self, admin_client, user_client, serializer_class, model
+    ):
+        create_catalog(12)
+        Title.objects.create(
+            name='Без описания', year=1990, category=Category.objects.first()
+        )
+        self.create_discussion(admin_client, user_client)
+        assert model.objects.count() >= 2
+        before, after = render_both(serializer_class, model.objects.all())
+        assert before == after, (
+            f'Проверьте, что быстрый путь для `{serializer_class.__name__}` '
+            'выдаёт тот же JSON, что и сериализатор DRF.'
+        )
+
+    def test_02_identical_json_for_fields(self):
+        create_catalog(5)
+        before, after = render_both(
+            TitleReadSerializer, Title.objects.all(), ('name', 'genre')
+        )
+        assert before == after
+
+    def test_03_list_endpoints(self, client, django_assert_num_queries):
+        create_catalog(12)
+        with django_assert_num_queries(3):
+            response = client.get(self.TITLES_URL)
+        titles = Title.objects.select_related('category').prefetch_related(
+            'genre'
+        )[:10]
+        assert response.json()['results'] == json.loads(
+            JSONRenderer().render(TitleReadSerializer(titles, many=True).data)
+        ), (
+            'Проверьте, что список произведений строится быстрым путём '
+            'без изменения ответа.'
+        )
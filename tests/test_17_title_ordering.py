@@ -0,0 +1,101 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Title
+from tests.utils import create_catalog
+
+
+@pytest.mark.django_db
+class Test17TitleOrdering:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def fill_aggregates(self):
+        for index, title in enumerate(Title.objects.order_by('id')):
+            Title.objects.filter(pk=title.pk).update(
+                year=1990 + index % 3,
+                review_count=index % 4,
+                rating=None if index % 4 == 0 else index % 5 + 1,
+            )
+
+    def get_ids(self, client, ordering):
+        response = client.get(self.TITLES_URL, {'ordering': ordering})
+        assert response.status_code == HTTPStatus.OK
+        return [title['id'] for title in response.json()['results']]
+
+    @pytest.mark.parametrize('ordering, key', (
+        ('-rating', lambda title: (
+            title.rating is None, -(title.rating or 0), -title.id
+        )),
+        ('rating', lambda title: (
+            title.rating is not None, title.rating or 0, title.id
+        )),
+        ('year', lambda title: (title.year, title.id)),
+        ('-review_count', lambda title: (-title.review_count, -title.id)),
+        ('name', lambda title: (title.name, title.id)),
+        ('year,-rating', lambda title: (
+            title.year, title.rating is None, -(title.rating or 0), -title.id
+        )),
+    ))
+    def test_01_ordering(self, client, ordering, key):
+        create_catalog(10)
+        self.fill_aggregates()
+        expected = [title.id for title in sorted(Title.objects.all(), key=key)]
+        assert self.get_ids(client, ordering) == expected, (
+            f'Проверьте, что `{self.TITLES_URL}?ordering={ordering}` '
+            'сортирует произведения по сохранённому полю, а при равенстве '
+            'значений — по id в том же направлении.'
+        )
+
+    def test_02_ordering_with_filter(self, client):
+        create_catalog(10)
+        self.fill_aggregates()
+        response = client.get(
+            self.TITLES_URL, {'ordering': '-rating', 'genre': 'genre-0'}
+        )
+        ratings = [
+            title['rating'] for title in response.json()['results']
+            if title['rating'] is not None
+        ]
+        assert ratings and ratings == sorted(ratings, reverse=True), (
+            'Проверьте, что сортировка совместима с фильтрами.'
+        )
+
+    def test_03_unknown_ordering(self, client):
+        response = client.get(self.TITLES_URL, {'ordering': 'description'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что сортировка по неподдерживаемому полю '
+            'возвращает статус 400.'
+        )
+        assert 'ordering' in response.json()
+
+    @pytest.mark.parametrize('params, param', (
+        ({'cursor': '', 'ordering': '-year'}, 'ordering'),
+        ({'cursor': '', 'ordering': '-year', 'fields': 'name'}, 'ordering'),
+        ({'cursor': '', 'search': 'произведение'}, 'search'),
+        ({'cursor': '', 'search': 'произведение', 'fields': 'id'}, 'search'),
+    ))
+    def test_04_ordering_with_cursor(self, client, params, param):
+        create_catalog(3)
+        response = client.get(self.TITLES_URL, params)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что сортировка или поиск вместе с курсорной '
+            'пагинацией возвращает статус 400.'
+        )
+        assert param in response.json()
+
+    def test_05_cursor_with_fields(self, client):
+        create_catalog(15)
+        url, received = f'{self.TITLES_URL}?cursor=&fields=id', []
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            received.extend(title['id'] for title in response.json()[
+                'results'
+            ])
+            url = response.json()['next']
+        assert received == list(Title.objects.values_list('id', flat=True)), (
+            'Проверьте, что курсорная пагинация работает с параметром '
+            '`fields`, не содержащим полей ключа сортировки.'
+        )
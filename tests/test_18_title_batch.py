@@ -0,0 +1,64 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Title
+from tests.utils import create_catalog
+
+BATCH_QUERIES = 2  # произведения с категориями, жанры
+
+
+@pytest.mark.django_db
+class Test18TitleBatch:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    @pytest.mark.parametrize('size', (3, 50))
+    def test_01_batch_preserves_order(self, client, size,
+                                      django_assert_num_queries):
+        create_catalog(size)
+        ids = list(Title.objects.values_list('id', flat=True))[::-1]
+        with django_assert_num_queries(BATCH_QUERIES):
+            response = client.get(
+                self.TITLES_URL, {'ids': ','.join(map(str, ids))}
+            )
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert [title['id'] for title in data['results']] == ids, (
+            f'Проверьте, что `{self.TITLES_URL}?ids=...` возвращает '
+            'произведения в порядке запроса за постоянное число запросов.'
+        )
+        assert data['missing'] == []
+        assert data['results'][0] == client.get(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=ids[0])
+        ).json(), (
+            'Проверьте, что произведения в пакете совпадают с ответом '
+            'на запрос отдельного произведения.'
+        )
+
+    def test_02_missing_ids(self, client):
+        create_catalog(2)
+        first, second = Title.objects.values_list('id', flat=True)
+        response = client.get(
+            self.TITLES_URL,
+            {'ids': f'{second},999999,{first},{second}', 'fields': 'id'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            'results': [{'id': second}, {'id': first}],
+            'missing': [999999],
+        }, (
+            'Проверьте, что ненайденные id перечисляются в `missing`, '
+            'а повторяющиеся id возвращаются один раз.'
+        )
+
+    @pytest.mark.parametrize('ids', ('', 'a,b', '-1', ','.join(
+        map(str, range(1, 102))
+    )))
+    def test_03_invalid_ids(self, client, ids):
+        response = client.get(self.TITLES_URL, {'ids': ids})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что некорректный или слишком длинный список '
+            '`ids` возвращает статус 400.'
+        )
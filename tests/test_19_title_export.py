@@ -0,0 +1,70 @@
+import csv
+import gzip
+import io
+import json
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Title
+from tests.utils import create_catalog
+
+
+@pytest.mark.django_db
+class Test19TitleExport:
+
+    EXPORT_URL = '/api/v1/titles/export/'
+
+    def read(self, response):
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming, (
+            f'Проверьте, что `{self.EXPORT_URL}` отдаёт выгрузку потоком.'
+        )
+        return b''.join(response.streaming_content)
+
+    def test_01_ndjson(self, admin_client, django_assert_num_queries,
+                       monkeypatch):
+        monkeypatch.setattr('api.constants.EXPORT_CHUNK_SIZE', 4)
+        create_catalog(10)
+        response = admin_client.get(self.EXPORT_URL)
+        with django_assert_num_queries(4):
+            content = self.read(response)
+        titles = [json.loads(line) for line in content.decode().splitlines()]
+        assert [title['id'] for title in titles] == list(
+            Title.objects.order_by('id').values_list('id', flat=True)
+        ), (
+            'Проверьте, что выгрузка содержит все произведения по порядку id.'
+        )
+        assert len(titles[0]['genre']) == 2
+        assert titles[0]['category']['slug'].startswith('category-')
+        assert 'rating' in titles[0]
+
+    def test_02_csv_gzip(self, admin_client):
+        create_catalog(3)
+        response = admin_client.get(
+            self.EXPORT_URL, {'output': 'csv', 'category': 'category-0'},
+            HTTP_ACCEPT_ENCODING='gzip, deflate',
+        )
+        assert response['Content-Encoding'] == 'gzip'
+        assert response['Content-Type'].startswith('text/csv')
+        rows = list(csv.reader(io.StringIO(
+            gzip.decompress(self.read(response)).decode()
+        )))
+        assert rows[0][:3] == ['id', 'name', 'year']
+        assert len(rows) == 1 + Title.objects.filter(
+            category__slug='category-0'
+        ).count(), (
+            'Проверьте, что выгрузка в CSV учитывает фильтры и сжимается '
+            'gzip, если клиент его принимает.'
+        )
+        assert rows[1][-1].count(',') == 1
+
+    def test_03_admin_only(self, client, user_client, admin_client):
+        assert client.get(self.EXPORT_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert user_client.get(self.EXPORT_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        ), 'Проверьте, что выгрузка каталога доступна только администратору.'
+        response = admin_client.get(self.EXPORT_URL, {'output': 'xml'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,141 @@
+from http import HTTPStatus
+
+import pytest
+from rest_framework.pagination import PageNumberPagination
+
+from api.constants import REVIEW_VALIDATE_ERROR
+from reviews.models import Review, Title, User
+from tests.utils import create_catalog
+
+LIST_QUERIES = 2  # COUNT, отзывы с авторами
+EMPTY_LIST_QUERIES = 2  # COUNT, проверка произведения
+RETRIEVE_QUERIES = 1  # отзыв с автором
+# пользователь по токену, произведение, SAVEPOINT, INSERT,
+# пересчёт рейтинга, RELEASE SAVEPOINT
+CREATE_QUERIES = 6
+# пользователь по токену, отзыв с автором, прежняя оценка, UPDATE,
+# пересчёт рейтинга
+UPDATE_QUERIES = 5
+
+
+def create_reviews(title, count):
+    authors = User.objects.bulk_create(
+        User(username=f'reviewer{i}', email=f'reviewer{i}@yamdb.fake')
+        for i in range(count)
+    )
+    Review.objects.bulk_create(
+        Review(title=title, author_id=author.pk, text='Отзыв', score=5)
+        for author in User.objects.filter(
+            username__in=[author.username for author in authors]
+        )
+    )
+
+
+@pytest.mark.django_db
+class Test20ReviewQueries:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    @pytest.mark.parametrize('page_size', (10, 100))
+    def test_01_list_queries(self, client, monkeypatch, page_size,
+                             django_assert_num_queries):
+        create_catalog(1)
+        title = Title.objects.get()
+        create_reviews(title, page_size)
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        with django_assert_num_queries(LIST_QUERIES):
+            response = client.get(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk)
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()['results']) == page_size, (
+            'Проверьте, что список отзывов не загружает произведение '
+            'и авторов отдельными запросами.'
+        )
+
+    def test_02_empty_and_missing_title(self, client,
+                                        django_assert_num_queries):
+        create_catalog(1)
+        title = Title.objects.get()
+        with django_assert_num_queries(EMPTY_LIST_QUERIES):
+            response = client.get(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk)
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['results'] == []
+        response = client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk + 1)
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что список отзывов несуществующего произведения '
+            'возвращает статус 404.'
+        )
+
+    def test_03_retrieve_queries(self, client, django_assert_num_queries):
+        create_catalog(1)
+        title = Title.objects.get()
+        create_reviews(title, 1)
+        review = Review.objects.get()
+        with django_assert_num_queries(RETRIEVE_QUERIES):
+            response = client.get(self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title.pk, review_id=review.pk
+            ))
+        assert response.status_code == HTTPStatus.OK
+        response = client.get(self.REVIEW_DETAIL_URL_TEMPLATE.format(
+            title_id=title.pk + 1, review_id=review.pk
+        ))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что отзыв, запрошенный через чужое произведение, '
+            'не находится.'
+        )
+
+    def test_04_create_queries(self, user_client, django_assert_num_queries):
+        create_catalog(1)
+        title = Title.objects.get()
+        with django_assert_num_queries(CREATE_QUERIES):
+            response = user_client.post(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk),
+                {'text': 'Отзыв', 'score': 7}
+            )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что произведение загружается при создании отзыва '
+            'один раз.'
+        )
+
+    def test_05_duplicate_review(self, user_client):
+        create_catalog(1)
+        title = Title.objects.get()
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk)
+        user_client.post(url, {'text': 'Отзыв', 'score': 7})
+        response = user_client.post(url, {'text': 'Ещё отзыв', 'score': 1})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert REVIEW_VALIDATE_ERROR in str(response.json()), (
+            'Проверьте, что повторный отзыв, отсечённый ограничением '
+            'уникальности, возвращает прежнее сообщение об ошибке.'
+        )
+        title.refresh_from_db()
+        assert (title.review_count, title.rating) == (1, 7.0), (
+            'Проверьте, что отклонённый отзыв не меняет рейтинг.'
+        )
+
+    def test_06_author_update_queries(self, user, user_client,
+                                      django_assert_num_queries):
+        create_catalog(1)
+        title = Title.objects.get()
+        review = Review.objects.create(
+            title=title, author=user, text='Отзыв', score=5
+        )
+        with django_assert_num_queries(UPDATE_QUERIES):
+            response = user_client.patch(
+                self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                    title_id=title.pk, review_id=review.pk
+                ),
+                {'score': 9}
+            )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что права автора проверяются по `author_id` '
+            'без отдельной загрузки пользователя.'
+        )
@@ -0,0 +1,127 @@
+from http import HTTPStatus
+
+import pytest
+from rest_framework.pagination import PageNumberPagination
+
+from reviews.models import Comment, Review, Title, User
+from tests.utils import create_catalog
+
+LIST_QUERIES = 2  # COUNT, комментарии с авторами
+RETRIEVE_QUERIES = 1  # комментарий с автором
+# пользователь по токену, комментарий с автором, UPDATE
+UPDATE_QUERIES = 3
+# пользователь по токену, отзыв в произведении, INSERT, счётчик отзыва
+CREATE_QUERIES = 4
+
+
+@pytest.mark.django_db
+class Test21CommentQueries:
+
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+    COMMENT_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+        '{comment_id}/'
+    )
+
+    def create_comments(self, count):
+        create_catalog(1)
+        title = Title.objects.get()
+        User.objects.bulk_create(
+            User(username=f'commenter{i}', email=f'commenter{i}@yamdb.fake')
+            for i in range(count)
+        )
+        authors = list(User.objects.filter(username__startswith='commenter'))
+        review = Review.objects.create(
+            title=title, author=authors[0], text='Отзыв', score=5
+        )
+        Comment.objects.bulk_create(
+            Comment(review=review, title=title, author=author, text='Текст')
+            for author in authors
+        )
+        return title, review
+
+    @pytest.mark.parametrize('page_size', (10, 100))
+    def test_01_list_queries(self, client, monkeypatch, page_size,
+                             django_assert_num_queries):
+        title, review = self.create_comments(page_size)
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        with django_assert_num_queries(LIST_QUERIES):
+            response = client.get(self.COMMENTS_URL_TEMPLATE.format(
+                title_id=title.pk, review_id=review.pk
+            ))
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()['results']) == page_size, (
+            'Проверьте, что имена авторов комментариев загружаются '
+            'основным запросом.'
+        )
+
+    def test_02_retrieve_queries(self, client, django_assert_num_queries):
+        title, review = self.create_comments(1)
+        comment = Comment.objects.get()
+        with django_assert_num_queries(RETRIEVE_QUERIES):
+            response = client.get(self.COMMENT_DETAIL_URL_TEMPLATE.format(
+                title_id=title.pk, review_id=review.pk, comment_id=comment.pk
+            ))
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['author'] == comment.author.username
+
+    def test_03_author_update_queries(self, user, user_client,
+                                      django_assert_num_queries):
+        title, review = self.create_comments(1)
+        comment = Comment.objects.create(
+            review=review, title=title, author=user, text='Текст'
+        )
+        with django_assert_num_queries(UPDATE_QUERIES):
+            response = user_client.patch(
+                self.COMMENT_DETAIL_URL_TEMPLATE.format(
+                    title_id=title.pk, review_id=review.pk,
+                    comment_id=comment.pk
+                ),
+                {'text': 'Новый текст'}
+            )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что права автора комментария проверяются '
+            'по `author_id` без отдельной загрузки пользователя.'
+        )
+
+    def test_04_create_queries(self, user_client, django_assert_num_queries):
+        title, review = self.create_comments(1)
+        with django_assert_num_queries(CREATE_QUERIES):
+            response = user_client.post(
+                self.COMMENTS_URL_TEMPLATE.format(
+                    title_id=title.pk, review_id=review.pk
+                ),
+                {'text': 'Комментарий'}
+            )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что отзыв и его произведение определяются '
+            'одним запросом без загрузки произведения.'
+        )
+        assert Comment.objects.get(pk=response.json()['id']).title_id == (
+            title.pk
+        )
+
+    def test_05_mismatched_title(self, client, user_client):
+        title, review = self.create_comments(1)
+        comment = Comment.objects.get()
+        other_title = Title.objects.create(
+            name='Другое', year=2000, category=title.category
+        )
+        urls = (
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=other_title.pk, review_id=review.pk
+            ),
+            self.COMMENT_DETAIL_URL_TEMPLATE.format(
+                title_id=other_title.pk, review_id=review.pk,
+                comment_id=comment.pk
+            ),
+        )
+        for url in urls:
+            assert client.get(url).status_code == HTTPStatus.NOT_FOUND, (
+                'Проверьте, что отзыв, запрошенный через чужое '
+                'произведение, не находится.'
+            )
+        response = user_client.post(urls[0], {'text': 'Комментарий'})
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+
+from api.pagination import FeedKeysetPagination
+from reviews.models import Comment, Review, Title, User
+from tests.utils import create_catalog
+
+FEED_PAGE_QUERIES = 1  # страница отзывов с авторами, без COUNT
+
+
+def create_feed(size):
+    create_catalog(1)
+    title = Title.objects.get()
+    User.objects.bulk_create(
+        User(username=f'reader{i}', email=f'reader{i}@yamdb.fake')
+        for i in range(size)
+    )
+    authors = list(User.objects.filter(username__startswith='reader'))
+    Review.objects.bulk_create(
+        Review(title=title, author=author, text='Отзыв', score=5)
+        for author in authors
+    )
+    review = Review.objects.first()
+    Comment.objects.bulk_create(
+        Comment(review=review, title=title, author=author, text='Текст')
+        for author in authors
+    )
+    # Одинаковое время публикации у части записей: порядок
+    # должен однозначно определяться id.
+    same_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for model in (Review, Comment):
+        ids = list(model.objects.values_list('id', flat=True))
+        model.objects.filter(id__in=ids[::2]).update(pub_date=same_time)
+    return title, review
+
+
+@pytest.mark.django_db
+class Test22FeedCursorPagination:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def walk(self, client, url, queries=None, assert_num_queries=None):
+        url = f'{url}?cursor='
+        received = []
+        while url:
+            if assert_num_queries is None:
+                response = client.get(url)
+            else:
+                with assert_num_queries(queries):
+                    response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            assert 'count' not in data
+            received.extend(item['id'] for item in data['results'])
+            url = data['next']
+        return received
+
+    def test_01_reviews_cursor(self, client, django_assert_num_queries):
+        title, _ = create_feed(25)
+        expected = list(Review.objects.order_by(
+            '-pub_date', '-id'
+        ).values_list('id', flat=True))
+        received = self.walk(
+            client, self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk),
+            FEED_PAGE_QUERIES, django_assert_num_queries,
+        )
+        assert received == expected, (
+            'Проверьте, что курсорная пагинация отзывов возвращает '
+            'все отзывы ровно один раз, от новых к старым.'
+        )
+
+    def test_02_comments_cursor(self, client):
+        title, review = create_feed(25)
+        expected = list(Comment.objects.order_by(
+            '-pub_date', '-id'
+        ).values_list('id', flat=True))
+        received = self.walk(client, self.COMMENTS_URL_TEMPLATE.format(
+            title_id=title.pk, review_id=review.pk
+        ))
+        assert received == expected, (
+            'Проверьте, что курсорная пагинация комментариев возвращает '
+            'все комментарии ровно один раз, от новых к старым.'
+        )
+
+    @pytest.mark.parametrize('model, parent, index', (
+        (Review, 'title_id', 'review_title_pub_date_idx'),
+        (Comment, 'review_id', 'comment_review_pub_date_idx'),
+    ))
+    def test_03_seek_uses_index(self, model, parent, index):
+        pagination = FeedKeysetPagination()
+        queryset = model.objects.filter(**{parent: 1}).order_by(
+            *pagination.ordering
+        ).filter(pagination.get_seek_filter(
+            ['2024-01-01T00:00:00+00:00', 100]
+        ))[:pagination.page_size + 1]
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(row[-1] for row in cursor.fetchall())
+        assert index in plan and 'pub_date<' in plan.replace(' ', ''), (
+            'Проверьте, что страница ленты читается по составному индексу '
+            'с позиции курсора.'
+        )
+        assert 'TEMP B-TREE' not in plan
@@ -0,0 +1,88 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from reviews.models import Comment, Review, Title
+from tests.utils import create_catalog
+
+
+@pytest.mark.django_db
+class Test23Counters:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def create_discussion(self, admin_client, user_client):
+        create_catalog(1)
+        title = Title.objects.get()
+        review_id = admin_client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk),
+            {'text': 'Отзыв', 'score': 8}
+        ).json()['id']
+        comments_url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=title.pk, review_id=review_id
+        )
+        for author_client in (admin_client, user_client, user_client):
+            response = author_client.post(comments_url, {'text': 'Текст'})
+            assert response.status_code == HTTPStatus.CREATED
+        return title, review_id, comments_url
+
+    def test_01_counters_in_responses(self, client, admin_client,
+                                      user_client):
+        title, review_id, comments_url = self.create_discussion(
+            admin_client, user_client
+        )
+        reviews = client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk)
+        ).json()['results']
+        assert reviews[0]['comment_count'] == 3, (
+            'Проверьте, что ответ со списком отзывов содержит '
+            'количество комментариев к каждому отзыву.'
+        )
+        title_data = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title.pk)
+        ).json()
+        assert title_data['review_count'] == 1, (
+            'Проверьте, что ответ с произведением содержит '
+            'количество отзывов.'
+        )
+
+        comment_id = client.get(comments_url).json()['results'][0]['id']
+        user_client.delete(f'{comments_url}{comment_id}/')
+        reviews = client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk)
+        ).json()['results']
+        assert reviews[0]['comment_count'] == 2, (
+            'Проверьте, что счётчик комментариев уменьшается при удалении '
+            'комментария, а закэшированный список отзывов обновляется.'
+        )
+
+    def test_02_cascade_delete(self, admin_client, user, user_client):
+        title, review_id, _ = self.create_discussion(
+            admin_client, user_client
+        )
+        user.delete()
+        assert Review.objects.get(pk=review_id).comment_count == 1, (
+            'Проверьте, что каскадное удаление комментариев вместе '
+            'с автором учитывается в счётчике отзыва.'
+        )
+
+    def test_03_recalculate_counters_command(self, admin_client,
+                                             user_client):
+        title, review_id, _ = self.create_discussion(
+            admin_client, user_client
+        )
+        Review.objects.update(comment_count=0)
+        Title.objects.update(review_count=0)
+        call_command('recalculate_counters')
+        assert Review.objects.get(pk=review_id).comment_count == (
+            Comment.objects.count()
+        )
+        assert Title.objects.get(pk=title.pk).review_count == 1, (
+            'Проверьте, что команда `recalculate_counters` сверяет '
+            'счётчики с таблицами отзывов и комментариев.'
+        )
@@ -0,0 +1,134 @@
+from http import HTTPStatus
+
+import pytest
+from rest_framework.pagination import PageNumberPagination
+
+from api.constants import INCLUDE_MAX_LIMIT
+from reviews.models import Comment, Review, Title, User
+from tests.utils import create_catalog
+
+# произведение с категорией, жанры, последние отзывы с авторами
+TITLE_INCLUDE_QUERIES = 3
+# COUNT, отзывы с авторами, последние комментарии с авторами
+REVIEWS_INCLUDE_QUERIES = 3
+
+
+def create_feed(titles_count, reviews_count, comments_count):
+    create_catalog(titles_count)
+    User.objects.bulk_create(
+        User(username=f'author{i}', email=f'author{i}@yamdb.fake')
+        for i in range(reviews_count)
+    )
+    authors = list(User.objects.filter(username__startswith='author'))
+    titles = list(Title.objects.order_by('id'))
+    Review.objects.bulk_create(
+        Review(title=title, author=author, text=f'Отзыв {i}', score=5)
+        for title in titles
+        for i, author in enumerate(authors)
+    )
+    Comment.objects.bulk_create(
+        Comment(
+            review=review, title_id=review.title_id, author=authors[0],
+            text=f'Комментарий {i}',
+        )
+        for review in Review.objects.all()
+        for i in range(comments_count)
+    )
+    return titles
+
+
+def get_latest_reviews(client, url, params):
+    response = client.get(url, params)
+    assert response.status_code == HTTPStatus.OK
+    return response.json()['latest_reviews']
+
+
+@pytest.mark.django_db
+class Test24Includes:
+
+    TITLE_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_title_latest_reviews(self, client,
+                                     django_assert_num_queries):
+        titles = create_feed(2, 5, 0)
+        title = titles[0]
+        expected = list(
+            Review.objects.filter(title=title)
+            .order_by('-pub_date', '-id').values_list('id', flat=True)[:2]
+        )
+        with django_assert_num_queries(TITLE_INCLUDE_QUERIES):
+            response = client.get(
+                self.TITLE_URL_TEMPLATE.format(title_id=title.pk),
+                {'include': 'latest_reviews:2'},
+            )
+        assert response.status_code == HTTPStatus.OK
+        reviews = response.json()['latest_reviews']
+        assert [review['id'] for review in reviews] == expected, (
+            'Проверьте, что `include=latest_reviews:N` встраивает '
+            'N последних отзывов этого произведения.'
+        )
+        assert set(reviews[0]) == {
+            'id', 'text', 'author', 'score', 'pub_date', 'comment_count'
+        }
+        response = client.get(
+            self.TITLE_URL_TEMPLATE.format(title_id=title.pk)
+        )
+        assert 'latest_reviews' not in response.json()
+
+    @pytest.mark.parametrize('page_size', (2, 10))
+    def test_02_review_comments(self, client, monkeypatch, page_size,
+                                django_assert_num_queries):
+        title = create_feed(1, page_size, 4)[0]
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        with django_assert_num_queries(REVIEWS_INCLUDE_QUERIES):
+            response = client.get(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk),
+                {'include': 'comments:3'},
+            )
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()['results']
+        assert len(results) == page_size
+        for review in results:
+            expected = list(
+                Comment.objects.filter(review_id=review['id'])
+                .order_by('-pub_date', '-id')
+                .values_list('id', flat=True)[:3]
+            )
+            assert [
+                comment['id'] for comment in review['comments']
+            ] == expected, (
+                'Проверьте, что `include=comments:N` встраивает '
+                'в каждый отзыв N его последних комментариев.'
+            )
+
+    def test_03_invalid_include(self, client):
+        title = create_feed(1, 1, 0)[0]
+        for value in (
+            'unknown', f'latest_reviews:{INCLUDE_MAX_LIMIT + 1}',
+            'latest_reviews:0', 'latest_reviews:x',
+        ):
+            response = client.get(
+                self.TITLE_URL_TEMPLATE.format(title_id=title.pk),
+                {'include': value},
+            )
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                'Проверьте, что неизвестное имя или недопустимое количество '
+                'в параметре `include` возвращают статус 400.'
+            )
+
+    def test_04_include_invalidated_by_new_review(self, user_client,
+                                                  user):
+        title = create_feed(1, 1, 0)[0]
+        url = self.TITLE_URL_TEMPLATE.format(title_id=title.pk)
+        params = {'include': 'latest_reviews:5'}
+        assert len(get_latest_reviews(user_client, url, params)) == 1
+        response = user_client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title.pk),
+            {'text': 'Новый отзыв', 'score': 7},
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert len(get_latest_reviews(user_client, url, params)) == 2, (
+            'Проверьте, что новый отзыв делает устаревшим закэшированный '
+            'ответ произведения со встроенными отзывами.'
+        )
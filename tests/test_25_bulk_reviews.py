@@ -0,0 +1,133 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.bulk import import_reviews
+from reviews.models import Review, Title, User
+from reviews.ratings import recalculate_title_ratings
+from tests.utils import create_catalog
+
+BULK_URL = '/api/v1/reviews/bulk/'
+
+
+def create_authors(count):
+    User.objects.bulk_create(
+        User(username=f'partner{i}', email=f'partner{i}@yamdb.fake')
+        for i in range(count)
+    )
+
+
+@pytest.mark.django_db
+class Test25BulkReviews:
+
+    def test_01_permissions(self, client, user_client, moderator_client):
+        for api_client, status in (
+            (client, HTTPStatus.UNAUTHORIZED),
+            (user_client, HTTPStatus.FORBIDDEN),
+            (moderator_client, HTTPStatus.FORBIDDEN),
+        ):
+            response = api_client.post(
+                BULK_URL, '[]', content_type='application/json'
+            )
+            assert response.status_code == status, (
+                'Проверьте, что массовая загрузка отзывов доступна '
+                'только администратору.'
+            )
+
+    def test_02_per_row_results(self, admin_client):
+        create_catalog(2)
+        create_authors(3)
+        first, second = Title.objects.order_by('id')
+        Review.objects.create(
+            title=first, author=User.objects.get(username='partner2'),
+            text='Отзыв', score=1,
+        )
+        rows = [
+            {'title': first.pk, 'author': 'partner0', 'score': 10,
+             'text': 'Отлично', 'pub_date': '2015-05-01T10:00:00Z'},
+            {'title': first.pk, 'author': 'partner1', 'score': 11,
+             'text': 'Оценка вне диапазона'},
+            {'title': first.pk, 'author': 'partner0', 'score': 5,
+             'text': 'Повтор в загрузке'},
+            {'title': first.pk, 'author': 'partner2', 'score': 5,
+             'text': 'Повтор существующего'},
+            {'title': second.pk + 100, 'author': 'unknown', 'score': 5,
+             'text': 'Нет ссылок'},
+            {'title': second.pk, 'author': 'partner1', 'score': 4,
+             'text': 'Хорошо'},
+            {'title': second.pk, 'author': 'partner2'},
+            'не объект',
+        ]
+        response = admin_client.post(BULK_URL, rows, format='json')
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert (data['created'], data['failed']) == (2, 6)
+        results = data['results']
+        assert len(results) == len(rows), (
+            'Проверьте, что ответ содержит результат по каждой строке.'
+        )
+        assert 'id' in results[0] and 'id' in results[5]
+        assert set(results[1]['errors']) == {'score'}
+        assert set(results[2]['errors']) == {'non_field_errors'}
+        assert set(results[3]['errors']) == {'non_field_errors'}
+        assert set(results[4]['errors']) == {'title', 'author'}
+        assert set(results[6]['errors']) == {'score', 'text'}
+        assert set(results[7]['errors']) == {'non_field_errors'}
+        review = Review.objects.get(pk=results[0]['id'])
+        assert (review.author.username, review.score) == ('partner0', 10)
+        assert review.pub_date.year == 2015, (
+            'Проверьте, что переданная дата публикации сохраняется.'
+        )
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert (first.review_count, first.rating) == (2, 5.5), (
+            'Проверьте, что загрузка пересчитывает рейтинг произведений.'
+        )
+        assert (second.review_count, second.rating) == (1, 4.0)
+        assert (second.score_4_count, second.score_10_count) == (1, 0)
+
+    def test_03_chunked_queries(self, django_assert_num_queries):
+        create_catalog(3)
+        create_authors(10)
+        rows = [
+            {'title': title_id, 'author': f'partner{i}', 'score': 7,
+             'text': 'Отзыв'}
+            for title_id in Title.objects.values_list('id', flat=True)
+            for i in range(10)
+        ]
+        # на каждую из трёх пачек: произведения, авторы, существующие
+        # отзывы, SAVEPOINT, INSERT, id вставленных, UPDATE агрегатов
+        # произведения пачки, RELEASE SAVEPOINT
+        with django_assert_num_queries(3 * 8):
+            results = import_reviews(rows, chunk_size=10)
+        assert all('id' in result for result in results)
+        assert Review.objects.count() == 30
+        assert set(
+            Title.objects.values_list('review_count', flat=True)
+        ) == {10}
+
+    def test_04_payload_validation(self, admin_client):
+        response = admin_client.post(BULK_URL, {'title': 1}, format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что тело запроса должно быть списком отзывов.'
+        )
+
+    def test_05_aggregates_per_chunk(self):
+        create_catalog(3)
+        create_authors(6)
+        title_ids = list(Title.objects.values_list('id', flat=True))
+        rows = [
+            {'title': title_ids[i % 2], 'author': f'partner{i}',
+             'score': i + 1, 'text': 'Отзыв'}
+            for i in range(6)
+        ] + [
+            {'title': title_ids[2], 'author': f'partner{i}', 'score': 5,
+             'text': 'Отзыв'}
+            for i in range(2)
+        ]
+        import_reviews(rows, chunk_size=4)
+        assert recalculate_title_ratings() == 0, (
+            'Проверьте, что каждая пачка прибавляет к агрегатам '
+            'произведений все свои оценки, в том числе несколько '
+            'оценок одного произведения.'
+        )
@@ -0,0 +1,119 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from reviews.models import Comment, Review, Title, User
+from reviews.purge import get_next_batch_size, iter_purge_user_content
+from reviews.ratings import recalculate_title_ratings
+from tests.utils import create_catalog
+
+PURGE_URL_TEMPLATE = '/api/v1/users/{username}/purge/'
+
+
+def create_spam():
+    """
+    Спамер оставляет отзыв на каждое произведение и комментарии
+    к отзывам другого автора, тот отвечает на отзывы спамера.
+    """
+    create_catalog(3)
+    spammer = User.objects.create(username='spammer', email='s@yamdb.fake')
+    other = User.objects.create(username='other', email='o@yamdb.fake')
+    for title in Title.objects.all():
+        spam = Review.objects.create(
+            title=title, author=spammer, text='Спам', score=1
+        )
+        review = Review.objects.create(
+            title=title, author=other, text='Отзыв', score=9
+        )
+        for _ in range(2):
+            Comment.objects.create(
+                review=review, title=title, author=spammer, text='Спам'
+            )
+        Comment.objects.create(
+            review=spam, title=title, author=other, text='Ответ'
+        )
+    return spammer
+
+
+@pytest.mark.django_db
+class Test26PurgeUserContent:
+
+    def test_01_permissions(self, user_client, moderator_client):
+        spammer = create_spam()
+        url = PURGE_URL_TEMPLATE.format(username=spammer.username)
+        response = user_client.post(url)
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что удаление материалов пользователя недоступно '
+            'обычному пользователю.'
+        )
+        response = moderator_client.post(url)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что модератор может удалить материалы пользователя.'
+        )
+
+    def test_02_purge_keeps_aggregates(self, admin_client):
+        spammer = create_spam()
+        response = admin_client.post(
+            PURGE_URL_TEMPLATE.format(username=spammer.username)
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            'deleted': {'comments': 6, 'reviews': 3},
+            'remaining': {'comments': 0, 'reviews': 0},
+            'done': True,
+        }
+        assert not Review.objects.filter(author=spammer).exists()
+        assert not Comment.objects.filter(author=spammer).exists()
+        assert not Comment.objects.filter(text='Ответ').exists(), (
+            'Проверьте, что вместе с отзывами удаляются комментарии к ним.'
+        )
+        for title in Title.objects.all():
+            assert (title.review_count, title.rating) == (1, 9.0), (
+                'Проверьте, что удаление пересчитывает рейтинг произведений.'
+            )
+        assert set(
+            Review.objects.values_list('comment_count', flat=True)
+        ) == {0}, (
+            'Проверьте, что удаление пересчитывает счётчики комментариев.'
+        )
+        assert User.objects.filter(pk=spammer.pk).exists()
+
+    def test_03_batches(self):
+        spammer = create_spam()
+        progress = list(iter_purge_user_content(spammer.pk, batch_size=2))
+        assert [
+            (item['comments'], item['reviews']) for item in progress
+        ] == [(2, 0), (4, 0), (6, 0), (6, 2), (6, 3)], (
+            'Проверьте, что материалы удаляются пачками не больше '
+            'batch_size с отчётом о прогрессе после каждой.'
+        )
+
+    def test_04_batch_size_budget(self):
+        assert get_next_batch_size(500, 0.4, 0.2, 500) == 250
+        assert get_next_batch_size(500, 20.0, 0.2, 500) == 5
+        assert get_next_batch_size(100, 0.05, 0.2, 500) == 200
+        assert get_next_batch_size(400, 0.05, 0.2, 500) == 500
+        assert get_next_batch_size(100, 0.15, 0.2, 500) == 100
+
+    def test_05_command(self):
+        spammer = create_spam()
+        out = StringIO()
+        call_command('purge_user_content', spammer.username, stdout=out)
+        assert 'удалены' in out.getvalue()
+        assert not Review.objects.filter(author=spammer).exists()
+
+    def test_06_aggregates_shifted(self):
+        spammer = create_spam()
+        for score, review in enumerate(
+            Review.objects.filter(author=spammer).order_by('id'), start=2
+        ):
+            review.score = score
+            review.save()
+        list(iter_purge_user_content(spammer.pk, batch_size=2))
+        assert recalculate_title_ratings() == 0, (
+            'Проверьте, что удаление отзывов вычитает их оценки из '
+            'агрегатов и гистограмм произведений без расхождений '
+            'с полным пересчётом.'
+        )
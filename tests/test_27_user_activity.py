@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+from http import HTTPStatus
+
+import pytest
+
+from api.pagination import ActivityPagination
+from reviews.models import Comment, Review, Title, User
+from tests.utils import create_catalog
+
+# пользователь по имени, объединённая страница отзывов и комментариев
+ACTIVITY_PAGE_QUERIES = 2
+
+
+def create_activity(author):
+    """
+    Отзывы автора на все произведения и комментарии к отзыву другого
+    автора; у части записей одинаковое время публикации, а id отзывов
+    и комментариев пересекаются.
+    """
+    create_catalog(5)
+    other = User.objects.create(username='other', email='o@yamdb.fake')
+    titles = list(Title.objects.all())
+    Review.objects.bulk_create(
+        Review(title=title, author=author, text='Отзыв', score=7)
+        for title in titles
+    )
+    review = Review.objects.create(
+        title=titles[0], author=other, text='Чужой отзыв', score=3
+    )
+    Comment.objects.bulk_create(
+        Comment(review=review, title=titles[0], author=author, text='Ответ')
+        for _ in range(6)
+    )
+    same_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for model in (Review, Comment):
+        ids = list(model.objects.values_list('id', flat=True))
+        model.objects.filter(id__in=ids[::2]).update(pub_date=same_time)
+
+
+def get_expected(author):
+    items = [
+        (item.pub_date, item.pk, kind)
+        for kind, model in (('review', Review), ('comment', Comment))
+        for item in model.objects.filter(author=author)
+    ]
+    return [
+        (kind, pk) for _, pk, kind in sorted(items, reverse=True)
+    ]
+
+
+@pytest.mark.django_db
+class Test27UserActivity:
+
+    ACTIVITY_URL_TEMPLATE = '/api/v1/users/{username}/activity/'
+
+    def walk(self, client, url, assert_num_queries, queries):
+        received = []
+        while url:
+            with assert_num_queries(queries):
+                response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            received.extend(
+                (item['type'], item['id']) for item in data['results']
+            )
+            url = data['next']
+        return received
+
+    def test_01_activity_pages(self, client, user, monkeypatch,
+                               django_assert_num_queries):
+        create_activity(user)
+        monkeypatch.setattr(ActivityPagination, 'page_size', 3)
+        received = self.walk(
+            client,
+            self.ACTIVITY_URL_TEMPLATE.format(username=user.username),
+            django_assert_num_queries,
+            ACTIVITY_PAGE_QUERIES,
+        )
+        assert received == get_expected(user), (
+            'Проверьте, что лента пользователя содержит все его отзывы '
+            'и комментарии от новых к старым без повторов и пропусков.'
+        )
+
+    def test_02_item_fields(self, client, user):
+        create_activity(user)
+        response = client.get(
+            self.ACTIVITY_URL_TEMPLATE.format(username=user.username)
+        )
+        results = response.json()['results']
+        review = next(item for item in results if item['type'] == 'review')
+        comment = next(
+            item for item in results if item['type'] == 'comment'
+        )
+        assert review['score'] == 7 and review['review'] is None
+        assert comment['score'] is None
+        assert comment['review'] == Review.objects.get(
+            author__username='other'
+        ).pk
+        assert set(review) == {
+            'type', 'id', 'title', 'review', 'text', 'score', 'pub_date'
+        }
+
+    def test_03_profile_activity(self, user_client, user):
+        create_activity(user)
+        response = user_client.get(
+            self.ACTIVITY_URL_TEMPLATE.format(username='me')
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что `/users/me/activity/` доступен '
+            'аутентифицированному пользователю.'
+        )
+        assert len(response.json()['results']) == 10
+
+    def test_04_errors(self, client, user):
+        response = client.get(
+            self.ACTIVITY_URL_TEMPLATE.format(username='missing')
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        response = client.get(
+            self.ACTIVITY_URL_TEMPLATE.format(username='me')
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        response = client.get(
+            self.ACTIVITY_URL_TEMPLATE.format(username=user.username),
+            {'cursor': 'не курсор'},
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,178 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Comment, Review, Title, User
+from reviews.search import COMMENT_SEARCH_INDEX, REVIEW_SEARCH_INDEX
+from tests.utils import create_catalog
+
+SEARCH_URL = '/api/v1/search/'
+
+
+def create_texts():
+    create_catalog(2)
+    first, second = Title.objects.order_by('id')
+    authors = [
+        User.objects.create(username=f'writer{i}', email=f'w{i}@yamdb.fake')
+        for i in range(3)
+    ]
+    insult = Review.objects.create(
+        title=first, author=authors[0], score=1,
+        text='Режиссёр — бездарь, бездарь и ещё раз бездарь.',
+    )
+    Review.objects.create(
+        title=second, author=authors[1], score=9,
+        text='Актёры не бездари, отличный фильм.',
+    )
+    Review.objects.create(
+        title=first, author=authors[1], score=8, text='Хорошее кино.'
+    )
+    Comment.objects.create(
+        review=insult, title=first, author=authors[2],
+        text='Сам ты бездарь.',
+    )
+    Comment.objects.create(
+        review=insult, title=first, author=authors[1], text='Согласен.'
+    )
+
+
+@pytest.mark.django_db
+class Test28TextSearch:
+
+    def search(self, client, text, **params):
+        response = client.get(SEARCH_URL, {'search': text, **params})
+        assert response.status_code == HTTPStatus.OK
+        return [
+            (item['type'], item['text']) for item in response.json()['results']
+        ]
+
+    def test_01_permissions(self, client, user_client, moderator_client):
+        create_texts()
+        assert client.get(
+            SEARCH_URL, {'search': 'бездарь'}
+        ).status_code == HTTPStatus.UNAUTHORIZED
+        assert user_client.get(
+            SEARCH_URL, {'search': 'бездарь'}
+        ).status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что поиск по отзывам и комментариям недоступен '
+            'обычному пользователю.'
+        )
+        assert moderator_client.get(
+            SEARCH_URL, {'search': 'бездарь'}
+        ).status_code == HTTPStatus.OK
+
+    def test_02_ranked_hits(self, moderator_client):
+        create_texts()
+        hits = self.search(moderator_client, 'бездар')
+        assert hits[0] == (
+            'review', 'Режиссёр — бездарь, бездарь и ещё раз бездарь.'
+        ), (
+            'Проверьте, что результаты упорядочены по релевантности.'
+        )
+        assert set(hits) == {
+            ('review', 'Режиссёр — бездарь, бездарь и ещё раз бездарь.'),
+            ('review', 'Актёры не бездари, отличный фильм.'),
+            ('comment', 'Сам ты бездарь.'),
+        }, (
+            'Проверьте, что поиск идёт по отзывам и комментариям '
+            'по началу слова.'
+        )
+        assert self.search(moderator_client, 'бездарь', type='comment') == [
+            ('comment', 'Сам ты бездарь.')
+        ]
+        assert self.search(moderator_client, 'режиссер') == [
+            ('review', 'Режиссёр — бездарь, бездарь и ещё раз бездарь.')
+        ], (
+            'Проверьте, что поиск не различает буквы «е» и «ё».'
+        )
+
+    def test_03_pagination_and_fields(self, moderator_client):
+        create_texts()
+        response = moderator_client.get(SEARCH_URL, {'search': 'бездар'})
+        data = response.json()
+        assert data['count'] == 3
+        assert set(data['results'][0]) == {
+            'type', 'id', 'title', 'review', 'text', 'score', 'pub_date',
+            'author',
+        }
+        assert data['results'][0]['author'] == 'writer0'
+
+    def test_04_invalid_params(self, moderator_client):
+        for params in ({}, {'search': ' '}, {'search': 'a', 'type': 'user'}):
+            response = moderator_client.get(SEARCH_URL, params)
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                'Проверьте, что запрос без текста или с неизвестным типом '
+                'записей возвращает статус 400.'
+            )
+
+    def test_05_query_without_words(self, moderator_client):
+        create_texts()
+        for text in ('!!!', '---'):
+            assert self.search(moderator_client, text) == [], (
+                'Проверьте, что запрос без слов возвращает пустой список.'
+            )
+
+    def test_06_rank_without_correlated_match(self, moderator_client):
+        create_texts()
+        title = Title.objects.first()
+        authors = User.objects.bulk_create(
+            User(username=f'critic{i}', email=f'c{i}@yamdb.fake')
+            for i in range(300)
+        )
+        authors = User.objects.filter(username__startswith='critic')
+        Review.objects.bulk_create(
+            Review(title=title, author=author, score=2,
+                   text=f'Бездарь номер {index}.')
+            for index, author in enumerate(authors)
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = moderator_client.get(SEARCH_URL, {'search': 'бездар'})
+        assert response.json()['count'] == 303
+        ranked = [
+            query['sql'] for query in queries.captured_queries
+            if 'bm25' in query['sql']
+        ]
+        assert ranked
+        for sql in ranked:
+            assert sql.count('MATCH') == 2, (
+                'Проверьте, что MATCH выполняется один раз на каждую '
+                'часть объединения, а не для каждого совпадения.'
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                plan = [row[-1] for row in cursor.fetchall()]
+            assert not any('CORRELATED' in detail for detail in plan), (
+                'Проверьте, что релевантность вычисляется в соединении '
+                'с индексом FTS5, а не коррелированным подзапросом.'
+            )
+
+    def test_07_index_follows_changes(self, moderator_client):
+        create_texts()
+        Comment.objects.filter(text='Сам ты бездарь.').update(
+            text='Сам ты критик.'
+        )
+        Review.objects.filter(score=9).delete()
+        assert self.search(moderator_client, 'бездар') == [
+            ('review', 'Режиссёр — бездарь, бездарь и ещё раз бездарь.')
+        ], (
+            'Проверьте, что индекс обновляется при изменении и удалении '
+            'отзывов и комментариев.'
+        )
+        with connection.cursor() as cursor:
+            for index in (REVIEW_SEARCH_INDEX, COMMENT_SEARCH_INDEX):
+                cursor.execute(
+                    f"INSERT INTO {index.table}({index.table}) "
+                    "VALUES ('delete-all')"
+                )
+        assert self.search(moderator_client, 'критик') == []
+        call_command('rebuild_search_index', stdout=StringIO())
+        assert self.search(moderator_client, 'критик') == [
+            ('comment', 'Сам ты критик.')
+        ], (
+            'Проверьте, что rebuild_search_index перестраивает индексы '
+            'отзывов и комментариев.'
+        )
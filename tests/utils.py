@@ -1,5 +1,7 @@
 from http import HTTPStatus
 
+from reviews.models import Category, Genre, Title
+
 
 check_name_and_slug_patterns = (
     (
@@ -305,3 +307,29 @@ def check_fields(obj_type, url_pattern, obj, expected_data, detail=False):
         f'данные {obj_types[obj_type]}{results_in_msg}. Поле `id` не '
         'найдено или не является целым числом.'
     )
+
+
+def create_catalog(size):
+    Category.objects.bulk_create(
+        Category(name=f'Категория {i}', slug=f'category-{i}')
+        for i in range(3)
+    )
+    Genre.objects.bulk_create(
+        Genre(name=f'Жанр {i}', slug=f'genre-{i}') for i in range(4)
+    )
+    categories = list(Category.objects.all())
+    genres = list(Genre.objects.all())
+    Title.objects.bulk_create(
+        Title(
+            name=f'Произведение {i}',
+            year=2000,
+            category=categories[i % len(categories)],
+            description='Описание',
+        )
+        for i in range(size)
+    )
+    Title.genre.through.objects.bulk_create(
+        Title.genre.through(title_id=title_id, genre_id=genre.id)
+        for title_id in Title.objects.values_list('id', flat=True)
+        for genre in genres[:2]
+    )